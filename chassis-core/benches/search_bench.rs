@@ -300,6 +300,38 @@ fn bench_best_case(c: &mut Criterion) {
     group.finish();
 }
 
+/// Benchmark: Neighbor prefetch depth and width
+///
+/// 768d rows span 48 cache lines, so this is where prefetching ahead of the
+/// distance loop should pay off if it pays off at all. `DEFAULT_PREFETCH_DEPTH`
+/// stays 0 until `depth_*` beats `off` here.
+fn bench_prefetch(c: &mut Criterion) {
+    let mut group = c.benchmark_group("prefetch");
+    group.sample_size(20);
+
+    let (mut graph, _temp) = build_benchmark_graph(5000, 768, 16);
+    let query = vec![0.5; 768];
+
+    graph.prefetch_depth = 0;
+    group.bench_function("off", |b| {
+        b.iter(|| black_box(graph.search(&query, 10, 100).unwrap()));
+    });
+
+    for depth in [2, 4] {
+        for full_vector in [false, true] {
+            graph.prefetch_depth = depth;
+            graph.prefetch_full_vector = full_vector;
+
+            let name = if full_vector { "full_vector" } else { "first_line" };
+            group.bench_with_input(BenchmarkId::new(name, depth), &depth, |b, _| {
+                b.iter(|| black_box(graph.search(&query, 10, 100).unwrap()));
+            });
+        }
+    }
+
+    group.finish();
+}
+
 criterion_group!(
     benches,
     bench_search_baseline,
@@ -312,6 +344,7 @@ criterion_group!(
     bench_visited_filter_overhead,
     bench_worst_case,
     bench_best_case,
+    bench_prefetch,
 );
 
 criterion_main!(benches);
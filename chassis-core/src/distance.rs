@@ -50,6 +50,27 @@ pub fn euclidean_distance(a: &[f32], b: &[f32]) -> f32 {
     euclidean_distance_scalar(a, b)
 }
 
+/// Name of the kernel [`euclidean_distance`] dispatches to on this CPU.
+///
+/// Returns `"avx2"`, `"neon"` or `"scalar"`, using the same runtime
+/// detection as [`euclidean_distance`]. Useful for logging and for checking
+/// which code path benchmarks and tests actually exercised.
+pub fn active_kernel() -> &'static str {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            return "avx2";
+        }
+    }
+
+    #[cfg(target_arch = "aarch64")]
+    {
+        return "neon";
+    }
+
+    "scalar"
+}
+
 /// Scalar implementation (portable fallback)
 #[inline]
 pub fn euclidean_distance_scalar(a: &[f32], b: &[f32]) -> f32 {
@@ -253,6 +274,146 @@ pub fn cosine_distance(a: &[f32], b: &[f32]) -> f32 {
     1.0 - (dot / norm_product)
 }
 
+/// Euclidean distance between an `f32` query and a `u8`-quantized row.
+///
+/// Each code decodes as `min[d] + code[d] * scale[d]` (ADR-0007). The query
+/// keeps full precision; codes are widened to `f32` in registers, so no
+/// decoded row is materialized.
+///
+/// # Architecture Dispatch
+///
+/// - x86_64 + AVX2 + FMA: Widens 8 codes per step (runtime detection)
+/// - Fallback: Portable scalar implementation
+#[cfg_attr(not(feature = "internals"), allow(dead_code))]
+#[inline]
+pub(crate) fn euclidean_distance_u8(query: &[f32], code: &[u8], min: &[f32], scale: &[f32]) -> f32 {
+    debug_assert_eq!(query.len(), code.len());
+    debug_assert_eq!(query.len(), min.len());
+    debug_assert_eq!(query.len(), scale.len());
+
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma") {
+            // SAFETY: avx2 and fma were detected at runtime, and all four
+            // slices have the same length (checked by the caller)
+            return unsafe { euclidean_distance_u8_avx2(query, code, min, scale) };
+        }
+    }
+
+    euclidean_distance_u8_scalar(query, code, min, scale)
+}
+
+/// Scalar implementation of [`euclidean_distance_u8`] (portable fallback)
+#[cfg_attr(not(feature = "internals"), allow(dead_code))]
+#[inline]
+pub(crate) fn euclidean_distance_u8_scalar(
+    query: &[f32],
+    code: &[u8],
+    min: &[f32],
+    scale: &[f32],
+) -> f32 {
+    let mut sum = 0.0_f32;
+
+    for d in 0..query.len() {
+        let diff = query[d] - (min[d] + code[d] as f32 * scale[d]);
+        sum += diff * diff;
+    }
+
+    sum.sqrt()
+}
+
+/// AVX2 implementation of [`euclidean_distance_u8`] with 2-way accumulator
+/// unrolling (x86_64 only)
+///
+/// Loads 8 codes per step, zero-extends them to `i32`, converts to `f32`
+/// and decodes with one FMA against the per-dimension `scale`/`min`.
+#[cfg(target_arch = "x86_64")]
+#[cfg_attr(not(feature = "internals"), allow(dead_code))]
+#[target_feature(enable = "avx2", enable = "fma")]
+unsafe fn euclidean_distance_u8_avx2(
+    query: &[f32],
+    code: &[u8],
+    min: &[f32],
+    scale: &[f32],
+) -> f32 {
+    use std::arch::x86_64::*;
+
+    let len = query.len();
+    let q = query.as_ptr();
+    let c = code.as_ptr();
+    let min_p = min.as_ptr();
+    let scale_p = scale.as_ptr();
+    let mut i = 0;
+
+    let mut sum0 = _mm256_setzero_ps();
+    let mut sum1 = _mm256_setzero_ps();
+
+    // Main loop: 16 dimensions per iteration (2 accumulators × 8 lanes)
+    while i + 16 <= len {
+        let (codes0, codes1) =
+            unsafe { (_mm_loadl_epi64(c.add(i).cast()), _mm_loadl_epi64(c.add(i + 8).cast())) };
+        let (scale0, scale1, min0, min1, q0, q1) = unsafe {
+            (
+                _mm256_loadu_ps(scale_p.add(i)),
+                _mm256_loadu_ps(scale_p.add(i + 8)),
+                _mm256_loadu_ps(min_p.add(i)),
+                _mm256_loadu_ps(min_p.add(i + 8)),
+                _mm256_loadu_ps(q.add(i)),
+                _mm256_loadu_ps(q.add(i + 8)),
+            )
+        };
+
+        // Widen u8 -> i32 -> f32, then decode: min + code * scale
+        let decoded0 =
+            _mm256_fmadd_ps(_mm256_cvtepi32_ps(_mm256_cvtepu8_epi32(codes0)), scale0, min0);
+        let decoded1 =
+            _mm256_fmadd_ps(_mm256_cvtepi32_ps(_mm256_cvtepu8_epi32(codes1)), scale1, min1);
+
+        let diff0 = _mm256_sub_ps(q0, decoded0);
+        let diff1 = _mm256_sub_ps(q1, decoded1);
+        sum0 = _mm256_fmadd_ps(diff0, diff0, sum0);
+        sum1 = _mm256_fmadd_ps(diff1, diff1, sum1);
+
+        i += 16;
+    }
+
+    // Tail loop: Process a remaining 8-dimension chunk
+    while i + 8 <= len {
+        let (codes, scale_v, min_v, q_v) = unsafe {
+            (
+                _mm_loadl_epi64(c.add(i).cast()),
+                _mm256_loadu_ps(scale_p.add(i)),
+                _mm256_loadu_ps(min_p.add(i)),
+                _mm256_loadu_ps(q.add(i)),
+            )
+        };
+        let decoded =
+            _mm256_fmadd_ps(_mm256_cvtepi32_ps(_mm256_cvtepu8_epi32(codes)), scale_v, min_v);
+        let diff = _mm256_sub_ps(q_v, decoded);
+        sum0 = _mm256_fmadd_ps(diff, diff, sum0);
+        i += 8;
+    }
+
+    // Horizontal reduction: Sum 8 lanes into a scalar
+    let sum_combined = _mm256_add_ps(sum0, sum1);
+    let sum_high = _mm256_extractf128_ps(sum_combined, 1);
+    let sum_low = _mm256_castps256_ps128(sum_combined);
+    let sum128 = _mm_add_ps(sum_low, sum_high);
+    let sum64 = _mm_add_ps(sum128, _mm_movehl_ps(sum128, sum128));
+    let sum32 = _mm_add_ss(sum64, _mm_shuffle_ps(sum64, sum64, 0x55));
+
+    let mut total = _mm_cvtss_f32(sum32);
+
+    // Scalar tail: Process remaining elements
+    while i < len {
+        let diff = query[i] - (min[i] + code[i] as f32 * scale[i]);
+        total += diff * diff;
+        i += 1;
+    }
+
+    total.sqrt()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -413,6 +574,15 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_active_kernel() {
+        let kernel = active_kernel();
+        assert!(["avx2", "neon", "scalar"].contains(&kernel));
+
+        #[cfg(target_arch = "aarch64")]
+        assert_eq!(kernel, "neon");
+    }
+
     #[cfg(target_arch = "aarch64")]
     #[test]
     fn test_neon_specific() {
@@ -23,6 +23,15 @@ const LEGACY_GRAPH_ZONE_START: u64 = 1024 * 1024 * 1024;
 /// Extra room left after the current vector zone when placing or relocating the graph.
 const VECTOR_ZONE_SLACK: usize = 8 * 1024 * 1024;
 
+/// Default number of neighbors prefetched ahead during search.
+///
+/// Off until `search_bench`'s `prefetch` group shows a gain on the target
+/// hardware; set `IndexOptions::prefetch_depth` to opt in.
+pub const DEFAULT_PREFETCH_DEPTH: usize = 0;
+
+/// Cache line size assumed for vector prefetching.
+const CACHE_LINE: usize = 64;
+
 /// Persistent graph header stored at the beginning of the graph zone.
 ///
 /// # Layout (64 bytes, 8-byte aligned)
@@ -187,6 +196,13 @@ pub struct HnswGraph {
 
     /// Number of nodes in the graph (tracked for header persistence)
     pub node_count: u64,
+
+    /// Neighbors whose vectors are prefetched ahead of the distance loop
+    /// during search (0 disables prefetching)
+    pub prefetch_depth: usize,
+
+    /// Prefetch every cache line of a vector instead of only the first
+    pub prefetch_full_vector: bool,
 }
 
 impl HnswGraph {
@@ -221,7 +237,17 @@ impl HnswGraph {
                 }
             };
 
-        Ok(Self { storage, params, record_params, graph_start, entry_point, max_layer, node_count })
+        Ok(Self {
+            storage,
+            params,
+            record_params,
+            graph_start,
+            entry_point,
+            max_layer,
+            node_count,
+            prefetch_depth: DEFAULT_PREFETCH_DEPTH,
+            prefetch_full_vector: true,
+        })
     }
 
     /// Try to read graph header if it exists
@@ -386,6 +412,35 @@ impl HnswGraph {
         Ok(crate::distance::euclidean_distance(query, vector_slice))
     }
 
+    /// Hint the CPU to start loading a node's vector into cache.
+    ///
+    /// Issues one prefetch per cache line of the vector, or only for the first
+    /// line unless `prefetch_full_vector` is set. Prefetches never fault and
+    /// never change results. A no-op for invalid IDs and on targets without a
+    /// stable prefetch intrinsic.
+    #[inline]
+    pub(crate) fn prefetch_vector(&self, node_id: NodeId) {
+        #[cfg(target_arch = "x86_64")]
+        {
+            use std::arch::x86_64::{_MM_HINT_T0, _mm_prefetch};
+
+            let Ok(vector) = self.storage.get_vector_slice(node_id) else {
+                return;
+            };
+            let bytes = if self.prefetch_full_vector { std::mem::size_of_val(vector) } else { 1 };
+            let base = vector.as_ptr().cast::<i8>();
+
+            for offset in (0..bytes).step_by(CACHE_LINE) {
+                // SAFETY: offset < size_of_val(vector), so the address lies
+                // inside the mapped vector
+                unsafe { _mm_prefetch::<_MM_HINT_T0>(base.add(offset)) };
+            }
+        }
+
+        #[cfg(not(target_arch = "x86_64"))]
+        let _ = node_id;
+    }
+
     /// Commit graph state (write header and flush to disk).
     ///
     /// # Performance Warning
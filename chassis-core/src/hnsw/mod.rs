@@ -5,7 +5,7 @@ pub mod node;
 mod search;
 
 pub use builder::HnswBuilder;
-pub use graph::HnswGraph;
+pub use graph::{DEFAULT_PREFETCH_DEPTH, HnswGraph};
 
 #[cfg(any(test, feature = "internals"))]
 pub use graph::GraphHeader;
@@ -49,6 +49,8 @@
 pub mod distance;
 mod header;
 mod hnsw;
+#[cfg(feature = "internals")]
+pub mod quantize;
 mod storage;
 
 #[cfg(feature = "internals")]
@@ -77,11 +79,24 @@ pub struct IndexOptions {
 
     /// Search quality parameter (efSearch)
     pub ef_search: usize,
+
+    /// Neighbors whose vectors are prefetched ahead during graph traversal
+    /// (0 disables prefetching). Affects speed only, never results.
+    pub prefetch_depth: usize,
+
+    /// Prefetch whole neighbor vectors instead of only their first cache line
+    pub prefetch_full_vector: bool,
 }
 
 impl Default for IndexOptions {
     fn default() -> Self {
-        Self { max_connections: 16, ef_construction: 200, ef_search: 50 }
+        Self {
+            max_connections: 16,
+            ef_construction: 200,
+            ef_search: 50,
+            prefetch_depth: hnsw::DEFAULT_PREFETCH_DEPTH,
+            prefetch_full_vector: true,
+        }
     }
 }
 
@@ -143,6 +158,8 @@ impl VectorIndex {
 
         // Open graph
         let mut graph = HnswGraph::open(storage, params)?;
+        graph.prefetch_depth = options.prefetch_depth;
+        graph.prefetch_full_vector = options.prefetch_full_vector;
 
         // Consistency check: Ghost node handling
         let storage_count = graph.storage.count();
@@ -246,14 +263,32 @@ impl VectorIndex {
     ///
     /// Returns an error if query dimensions don't match index dimensions
     pub fn search(&self, query: &[f32], k: usize) -> Result<Vec<SearchResult>> {
+        self.search_with_ef(query, k, self.options.ef_search)
+    }
+
+    /// Search for k nearest neighbors with a per-call search width
+    ///
+    /// Same as [`search`](Self::search), but uses `ef` instead of the
+    /// configured `ef_search` for this call only. Lets callers trade recall
+    /// for speed per query without reopening the index.
+    ///
+    /// # Arguments
+    ///
+    /// * `query` - Query vector (must match index dimensions)
+    /// * `k` - Number of nearest neighbors to return
+    /// * `ef` - Candidate list size for the base layer (raised to `k` if smaller)
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if query dimensions don't match index dimensions
+    pub fn search_with_ef(&self, query: &[f32], k: usize, ef: usize) -> Result<Vec<SearchResult>> {
         // Validate dimensions
         let dims = self.graph.storage.dimensions() as usize;
         if query.len() != dims {
             anyhow::bail!("Query dimension mismatch: expected {}, got {}", dims, query.len());
         }
 
-        // Delegate to graph search with configured ef_search
-        self.graph.search(query, k, self.options.ef_search)
+        self.graph.search(query, k, ef)
     }
 
     /// Flush all changes to disk
@@ -280,6 +315,22 @@ impl VectorIndex {
         Ok(())
     }
 
+    /// Change software prefetching for subsequent searches and inserts
+    ///
+    /// Prefetching is a runtime hint and is not stored in the file, so it can
+    /// be tuned per process. See [`IndexOptions::prefetch_depth`].
+    ///
+    /// # Arguments
+    ///
+    /// * `depth` - Neighbors to prefetch ahead (0 disables prefetching)
+    /// * `full_vector` - Prefetch whole vectors instead of only the first cache line
+    pub fn set_prefetch(&mut self, depth: usize, full_vector: bool) {
+        self.options.prefetch_depth = depth;
+        self.options.prefetch_full_vector = full_vector;
+        self.graph.prefetch_depth = depth;
+        self.graph.prefetch_full_vector = full_vector;
+    }
+
     /// Get the number of vectors in the index
     pub fn len(&self) -> u64 {
         self.graph.node_count()
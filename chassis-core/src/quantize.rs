@@ -0,0 +1,220 @@
+//! Scalar (`int8`) quantization of stored vectors.
+//!
+//! First stage of ADR-0007: the quantizer and the asymmetric distance kernel.
+//! Each dimension is mapped to one byte through a `(min, scale)` pair learned
+//! from a training batch, so a stored row takes `dims` bytes instead of
+//! `dims * 4`. Queries stay `f32` and are compared against the stored codes
+//! directly; a decoded row is never materialized.
+//!
+//! # Encoding
+//!
+//! ```text
+//! code[d]    = round((x[d] - min[d]) / scale[d])   clamped to 0..=255
+//! decoded[d] = min[d] + code[d] * scale[d]
+//! ```
+//!
+//! Values outside the trained range saturate to `0` or `255`.
+//!
+//! Not wired into `Storage`, `IndexOptions` or search yet, so this module is
+//! only compiled with the `internals` feature. The distance kernels live in
+//! `distance.rs` next to the `f32` ones, as ADR-0007 specifies.
+
+use crate::distance::euclidean_distance_u8;
+
+/// Per-dimension `u8` quantizer with asymmetric `f32` distance.
+#[derive(Debug, Clone, PartialEq)]
+pub struct ScalarQuantizer {
+    min: Vec<f32>,
+    scale: Vec<f32>,
+    inv_scale: Vec<f32>,
+}
+
+impl ScalarQuantizer {
+    /// Learn per-dimension ranges from a batch of vectors.
+    ///
+    /// # Arguments
+    ///
+    /// * `vectors` - Row-major training vectors (`len` must be a multiple of `dims`)
+    /// * `dims` - Number of dimensions per vector
+    ///
+    /// # Panics
+    ///
+    /// Panics if `dims` is zero, `vectors` is empty, or `vectors.len()` is
+    /// not a multiple of `dims`.
+    // `usize::is_multiple_of` needs Rust 1.87; the MSRV is 1.85
+    #[allow(clippy::manual_is_multiple_of)]
+    pub fn fit(vectors: &[f32], dims: usize) -> Self {
+        assert!(dims > 0, "dims must be positive");
+        assert!(
+            !vectors.is_empty() && vectors.len() % dims == 0,
+            "vectors must hold a positive whole number of rows"
+        );
+
+        let mut min = vec![f32::INFINITY; dims];
+        let mut max = vec![f32::NEG_INFINITY; dims];
+        for row in vectors.chunks_exact(dims) {
+            for d in 0..dims {
+                min[d] = min[d].min(row[d]);
+                max[d] = max[d].max(row[d]);
+            }
+        }
+
+        // A constant dimension gets scale 0: every value encodes to 0 and
+        // decodes back to min exactly.
+        let scale: Vec<f32> = min.iter().zip(&max).map(|(lo, hi)| (hi - lo) / 255.0).collect();
+        let inv_scale = scale.iter().map(|&s| if s > 0.0 { 1.0 / s } else { 0.0 }).collect();
+
+        Self { min, scale, inv_scale }
+    }
+
+    /// Number of dimensions this quantizer was trained on.
+    #[inline]
+    pub fn dimensions(&self) -> usize {
+        self.min.len()
+    }
+
+    /// Quantize one vector into `out`.
+    pub fn encode(&self, vector: &[f32], out: &mut [u8]) {
+        debug_assert_eq!(vector.len(), self.dimensions());
+        debug_assert_eq!(out.len(), self.dimensions());
+
+        for d in 0..vector.len() {
+            let q = ((vector[d] - self.min[d]) * self.inv_scale[d]).round();
+            out[d] = q.clamp(0.0, 255.0) as u8;
+        }
+    }
+
+    /// Reconstruct the `f32` approximation of a code into `out`.
+    pub fn decode(&self, code: &[u8], out: &mut [f32]) {
+        debug_assert_eq!(code.len(), self.dimensions());
+        debug_assert_eq!(out.len(), self.dimensions());
+
+        for d in 0..code.len() {
+            out[d] = self.min[d] + code[d] as f32 * self.scale[d];
+        }
+    }
+
+    /// Euclidean distance between an `f32` query and a quantized row.
+    ///
+    /// Uses the `distance::euclidean_distance_u8` kernel, which widens the
+    /// codes in registers instead of decoding the row into a buffer.
+    #[inline]
+    pub fn distance(&self, query: &[f32], code: &[u8]) -> f32 {
+        debug_assert_eq!(query.len(), self.dimensions());
+        debug_assert_eq!(code.len(), self.dimensions());
+
+        euclidean_distance_u8(query, code, &self.min, &self.scale)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::distance::{euclidean_distance, euclidean_distance_u8_scalar};
+    use rand::rngs::StdRng;
+    use rand::{Rng, SeedableRng};
+
+    fn random_vectors(rng: &mut StdRng, n: usize, dims: usize) -> Vec<f32> {
+        (0..n * dims).map(|_| rng.random::<f32>()).collect()
+    }
+
+    fn encode_all(quantizer: &ScalarQuantizer, vectors: &[f32], dims: usize) -> Vec<u8> {
+        let mut codes = vec![0u8; vectors.len()];
+        for (row, out) in vectors.chunks_exact(dims).zip(codes.chunks_exact_mut(dims)) {
+            quantizer.encode(row, out);
+        }
+        codes
+    }
+
+    fn top_k(distances: impl Iterator<Item = f32>, k: usize) -> Vec<usize> {
+        let mut ranked: Vec<(usize, f32)> = distances.enumerate().collect();
+        ranked.sort_by(|a, b| a.1.total_cmp(&b.1));
+        ranked.into_iter().take(k).map(|(id, _)| id).collect()
+    }
+
+    #[test]
+    fn test_round_trip_error_bounded() {
+        let mut rng = StdRng::seed_from_u64(0);
+        let dims = 32;
+        let vectors = random_vectors(&mut rng, 100, dims);
+        let quantizer = ScalarQuantizer::fit(&vectors, dims);
+
+        let mut code = vec![0u8; dims];
+        let mut decoded = vec![0.0f32; dims];
+        for row in vectors.chunks_exact(dims) {
+            quantizer.encode(row, &mut code);
+            quantizer.decode(&code, &mut decoded);
+            for d in 0..dims {
+                // Rounding error is at most half a quantization step
+                assert!((row[d] - decoded[d]).abs() <= quantizer.scale[d] * 0.5 + 1e-6);
+            }
+        }
+    }
+
+    #[test]
+    fn test_out_of_range_saturates() {
+        let quantizer = ScalarQuantizer::fit(&[0.0, 1.0, 1.0, 1.0], 2);
+        let mut code = [0u8; 2];
+
+        quantizer.encode(&[-5.0, 1.0], &mut code);
+        assert_eq!(code, [0, 0]); // below range, constant dimension
+
+        quantizer.encode(&[5.0, 7.0], &mut code);
+        assert_eq!(code, [255, 0]);
+    }
+
+    #[test]
+    fn test_distance_matches_decoded_reference() {
+        let mut rng = StdRng::seed_from_u64(1);
+        // Sizes exercise the main loop, the 8-wide tail and the scalar tail
+        for dims in [3, 8, 15, 16, 128, 131, 768] {
+            let vectors = random_vectors(&mut rng, 20, dims);
+            let quantizer = ScalarQuantizer::fit(&vectors, dims);
+            let query = random_vectors(&mut rng, 1, dims);
+
+            let mut code = vec![0u8; dims];
+            let mut decoded = vec![0.0f32; dims];
+            for row in vectors.chunks_exact(dims) {
+                quantizer.encode(row, &mut code);
+                quantizer.decode(&code, &mut decoded);
+
+                let reference = euclidean_distance(&query, &decoded);
+                let fast = quantizer.distance(&query, &code);
+                let scalar =
+                    euclidean_distance_u8_scalar(&query, &code, &quantizer.min, &quantizer.scale);
+
+                assert!((fast - reference).abs() < 1e-4, "dims {dims}: {fast} vs {reference}");
+                assert!((scalar - reference).abs() < 1e-4, "dims {dims}: {scalar} vs {reference}");
+            }
+        }
+    }
+
+    #[test]
+    fn test_int8_brute_force_recall() {
+        // Exact k-NN ranking by int8 distance vs f32 distance, i.e. the
+        // quantization error alone. ADR-0007's index-level recall check
+        // (HNSW over int8 storage) lands with the Storage integration.
+        const N: usize = 1000;
+        const DIMS: usize = 128;
+        const K: usize = 10;
+
+        let mut rng = StdRng::seed_from_u64(2);
+        let vectors = random_vectors(&mut rng, N, DIMS);
+        let queries = random_vectors(&mut rng, 50, DIMS);
+
+        let quantizer = ScalarQuantizer::fit(&vectors, DIMS);
+        let codes = encode_all(&quantizer, &vectors, DIMS);
+
+        let mut hits = 0;
+        for query in queries.chunks_exact(DIMS) {
+            let truth =
+                top_k(vectors.chunks_exact(DIMS).map(|row| euclidean_distance(query, row)), K);
+            let approx =
+                top_k(codes.chunks_exact(DIMS).map(|code| quantizer.distance(query, code)), K);
+            hits += approx.iter().filter(|id| truth.contains(id)).count();
+        }
+
+        let recall = hits as f32 / (50 * K) as f32;
+        assert!(recall >= 0.9, "int8 brute-force recall@10 = {recall}");
+    }
+}
@@ -176,7 +176,12 @@ fn test_large_batch_insert() {
 fn test_custom_options() {
     let temp_file = NamedTempFile::new().unwrap();
 
-    let options = IndexOptions { max_connections: 8, ef_construction: 100, ef_search: 25 };
+    let options = IndexOptions {
+        max_connections: 8,
+        ef_construction: 100,
+        ef_search: 25,
+        ..Default::default()
+    };
 
     let mut index = VectorIndex::open(temp_file.path(), 128, options).unwrap();
 
@@ -190,6 +195,71 @@ fn test_custom_options() {
     assert!(results.len() <= 5);
 }
 
+#[test]
+fn test_search_with_ef_override() {
+    let temp_file = NamedTempFile::new().unwrap();
+
+    let options = IndexOptions {
+        max_connections: 8,
+        ef_construction: 100,
+        ef_search: 10,
+        ..Default::default()
+    };
+    let mut index = VectorIndex::open(temp_file.path(), 16, options).unwrap();
+
+    for i in 0..100 {
+        index.add(&[i as f32; 16]).unwrap();
+    }
+
+    let query = [42.0; 16];
+
+    // The configured ef_search is the default
+    let default = index.search(&query, 5).unwrap();
+    let same = index.search_with_ef(&query, 5, 10).unwrap();
+    assert_eq!(
+        default.iter().map(|r| r.id).collect::<Vec<_>>(),
+        same.iter().map(|r| r.id).collect::<Vec<_>>()
+    );
+
+    // A wider search still finds the exact match first
+    let wide = index.search_with_ef(&query, 5, 200).unwrap();
+    assert_eq!(wide.len(), 5);
+    assert_eq!(wide[0].id, 42);
+
+    // ef below k is raised to k
+    let narrow = index.search_with_ef(&query, 5, 1).unwrap();
+    assert_eq!(narrow.len(), 5);
+
+    // Dimensions are still validated
+    assert!(index.search_with_ef(&[0.0; 8], 5, 50).is_err());
+}
+
+#[test]
+fn test_prefetch_options_preserve_results() {
+    let temp_file = NamedTempFile::new().unwrap();
+    let mut index = VectorIndex::open(temp_file.path(), 64, IndexOptions::default()).unwrap();
+
+    for i in 0..200 {
+        let vec: Vec<f32> = (0..64).map(|d| ((i * 31 + d * 7) % 97) as f32).collect();
+        index.add(&vec).unwrap();
+    }
+
+    let queries: Vec<Vec<f32>> =
+        (0..10).map(|q| (0..64).map(|d| ((q * 13 + d) % 89) as f32).collect()).collect();
+    let run = |index: &VectorIndex| -> Vec<Vec<u64>> {
+        queries
+            .iter()
+            .map(|q| index.search(q, 10).unwrap().iter().map(|r| r.id).collect())
+            .collect()
+    };
+
+    let expected = run(&index);
+    for (depth, full_vector) in [(0, false), (1, false), (2, true), (4, true)] {
+        index.set_prefetch(depth, full_vector);
+        assert_eq!(run(&index), expected, "depth={depth}, full_vector={full_vector}");
+    }
+}
+
 #[test]
 fn test_flush_durability() {
     let temp_file = NamedTempFile::new().unwrap();
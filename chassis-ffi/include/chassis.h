@@ -3,8 +3,8 @@
 
 /* Thread Safety: */
 /* - chassis_open, chassis_free: Thread-safe if called with different indices */
-/* - chassis_add, chassis_add_batch, chassis_flush: Single-writer (exclusive access required) */
-/* - chassis_search: Multi-reader (shared access allowed) */
+/* - chassis_add, chassis_add_batch, chassis_flush, chassis_set_prefetch: Single-writer (exclusive access required) */
+/* - chassis_search, chassis_search_with_ef, chassis_search_batch: Multi-reader (shared access allowed) */
 
 
 #ifndef CHASSIS_H
@@ -265,6 +265,110 @@ size_t chassis_add_batch(struct ChassisIndex *ptr, const float *vectors, size_t
  */
 size_t chassis_search(const struct ChassisIndex *ptr, const float *query, size_t len, size_t k, uint64_t *out_ids, float *out_dists);
 
+/**
+ * Search for k nearest neighbors with a per-call search width
+ *
+ * Same as `chassis_search()`, but `ef` overrides the index's configured
+ * `ef_search` for this call only.
+ *
+ * # Arguments
+ *
+ * - `ptr`: Non-NULL pointer to index (shared access allowed)
+ * - `query`: Pointer to query vector (must not be NULL)
+ * - `len`: Number of elements in query (must match index dimensions)
+ * - `k`: Number of neighbors to find (must be > 0)
+ * - `ef`: Candidate list size (raised to `k` if smaller); `0` uses the
+ *   index's `ef_search`
+ * - `out_ids`: Output buffer for vector IDs (must have space for k elements)
+ * - `out_dists`: Output buffer for distances (must have space for k elements)
+ *
+ * # Returns
+ *
+ * - Number of results found (≤ k) on success
+ * - 0 on failure (check `chassis_last_error_message()`)
+ *
+ * # Thread Safety
+ *
+ * **MULTI-READER**: Same as `chassis_search()`.
+ *
+ * # Example (C)
+ *
+ * ```c
+ * // Higher recall for this query only
+ * size_t count = chassis_search_with_ef(index, query, 768, 10, 400, ids, dists);
+ * ```
+ *
+ * # Safety
+ *
+ * - `ptr` must be non-NULL and valid
+ * - `query` must point to `len` valid f32 values
+ * - `out_ids` must have space for at least `k` u64 values
+ * - `out_dists` must have space for at least `k` float values
+ * - Buffers must not overlap
+ */
+size_t chassis_search_with_ef(const struct ChassisIndex *ptr, const float *query, size_t len, size_t k, size_t ef, uint64_t *out_ids, float *out_dists);
+
+/**
+ * Search for k nearest neighbors of multiple queries in one call (row-major layout)
+ *
+ * # Arguments
+ *
+ * - `ptr`: Non-NULL pointer to index (shared access allowed)
+ * - `queries`: Contiguous `num_queries * dim` floats: query `i` is
+ *   `queries[i*dim .. (i+1)*dim]`
+ * - `num_queries`: Number of queries
+ * - `dim`: Elements per query (must match index dimensions)
+ * - `k`: Number of neighbors to find per query (must be > 0)
+ * - `ef`: Candidate list size per query (raised to `k` if smaller); `0`
+ *   uses the index's `ef_search`
+ * - `out_ids`: Output buffer of `num_queries * k` vector IDs (row-major)
+ * - `out_dists`: Output buffer of `num_queries * k` distances (row-major)
+ *
+ * # Returns
+ *
+ * - Number of queries successfully processed
+ * - On first error, stops and returns the count processed so far; use
+ *   `chassis_last_error_message()` for the reason
+ * - If `num_queries == 0`, returns `0` and succeeds (pointers need not be valid)
+ *
+ * # Output Format
+ *
+ * Row `i` holds the results for query `i`, sorted by distance (ascending).
+ * If fewer than `k` neighbors are found, the remaining slots of the row are
+ * padded with `UINT64_MAX` IDs and `INFINITY` distances.
+ *
+ * # Thread Safety
+ *
+ * **MULTI-READER**: Same as `chassis_search()`.
+ *
+ * # Performance Note
+ *
+ * Amortizes FFI overhead across many queries. Large batches are split
+ * into contiguous blocks of rows and searched on scoped worker threads
+ * (up to the available parallelism); small batches run on the calling
+ * thread.
+ *
+ * # Example (C)
+ *
+ * ```c
+ * float *queries; // 100 * 768 elements, row-major
+ * uint64_t ids[100 * 10];
+ * float dists[100 * 10];
+ * size_t n = chassis_search_batch(index, queries, 100, 768, 10, 0, ids, dists);
+ * if (n < 100) {
+ *     fprintf(stderr, "Batch search failed: %s\n", chassis_last_error_message());
+ * }
+ * ```
+ *
+ * # Safety
+ *
+ * - `ptr` must be non-NULL and valid
+ * - If `num_queries > 0`, `queries` must point to `num_queries * dim` valid floats
+ * - `out_ids` and `out_dists` must each have space for `num_queries * k` values
+ * - Buffers must not overlap
+ */
+size_t chassis_search_batch(const struct ChassisIndex *ptr, const float *queries, size_t num_queries, size_t dim, size_t k, size_t ef, uint64_t *out_ids, float *out_dists);
+
 /**
  * Flush all changes to disk
  *
@@ -308,6 +412,44 @@ size_t chassis_search(const struct ChassisIndex *ptr, const float *query, size_t
  */
 int chassis_flush(struct ChassisIndex *ptr);
 
+/**
+ * Configure software prefetching during graph traversal
+ *
+ * Prefetching only affects speed, never results. It is a runtime setting
+ * and is not stored in the index file. New indexes start with depth 0
+ * (off) and full vectors.
+ *
+ * # Arguments
+ *
+ * - `ptr`: Non-NULL pointer to index (requires exclusive access)
+ * - `depth`: Neighbors whose vectors are prefetched ahead of the distance
+ *   loop (`0` disables prefetching)
+ * - `full_vector`: Non-zero to prefetch every cache line of a vector, zero
+ *   to prefetch only the first
+ *
+ * # Returns
+ *
+ * - 0 on success
+ * - -1 on failure (check `chassis_last_error_message()`)
+ *
+ * # Thread Safety
+ *
+ * **SINGLE-WRITER**: No other operations (read or write) may occur during
+ * this call.
+ *
+ * # Example (C)
+ *
+ * ```c
+ * chassis_set_prefetch(index, 4, 1);
+ * ```
+ *
+ * # Safety
+ *
+ * - `ptr` must be non-NULL and valid
+ * - No other thread may access `ptr` during this call
+ */
+int chassis_set_prefetch(struct ChassisIndex *ptr, size_t depth, int full_vector);
+
 /**
  * Get the number of vectors in the index
  *
@@ -417,6 +559,28 @@ const char *chassis_last_error_message(void);
  */
 const char *chassis_version(void);
 
+/**
+ * Get the name of the distance kernel selected on this CPU
+ *
+ * # Returns
+ *
+ * Pointer to NULL-terminated kernel name: `"avx2"`, `"neon"` or `"scalar"`.
+ * Selection happens at runtime and is the same for every index in the
+ * process.
+ *
+ * # Lifetime
+ *
+ * The returned pointer is valid for the lifetime of the program.
+ * **Do NOT** free the returned pointer.
+ *
+ * # Example (C)
+ *
+ * ```c
+ * printf("Distance kernel: %s\n", chassis_simd_kernel());
+ * ```
+ */
+const char *chassis_simd_kernel(void);
+
 #ifdef __cplusplus
 }  // extern "C"
 #endif  // __cplusplus
@@ -15,13 +15,15 @@
 //! Errors are reported through:
 //! - Return values: `u64::MAX` for add, `size_t` insert count for `chassis_add_batch`
 //!   (on partial failure, less than requested; on total failure of a non-empty batch, `0`),
-//!   `0` for search, `-1` for flush
+//!   `0` for search, processed query count for `chassis_search_batch`, `-1` for flush
 //! - Thread-local error message: `chassis_last_error_message()`
 //!
 //! # Thread Safety
 //!
-//! - Single-writer: `chassis_add`, `chassis_add_batch`, `chassis_flush` require exclusive access
-//! - Multi-reader: `chassis_search` allows concurrent readers
+//! - Single-writer: `chassis_add`, `chassis_add_batch`, `chassis_flush`, `chassis_set_prefetch`
+//!   require exclusive access
+//! - Multi-reader: `chassis_search`, `chassis_search_with_ef`, `chassis_search_batch`
+//!   allow concurrent readers
 //! - Each thread has its own error message storage
 
 use chassis_core::{IndexOptions, VectorIndex};
@@ -262,6 +264,7 @@ pub unsafe extern "C" fn chassis_open_with_options(
             max_connections: max_connections as u16,
             ef_construction: ef_construction as usize,
             ef_search: ef_search as usize,
+            ..IndexOptions::default()
         };
 
         match VectorIndex::open(path_str, dimensions, options) {
@@ -576,6 +579,60 @@ pub unsafe extern "C" fn chassis_search(
     k: size_t,
     out_ids: *mut u64,
     out_dists: *mut c_float,
+) -> size_t {
+    // SAFETY: Same contract as chassis_search_with_ef; ef = 0 selects the
+    // index's configured ef_search
+    unsafe { chassis_search_with_ef(ptr, query, len, k, 0, out_ids, out_dists) }
+}
+
+/// Search for k nearest neighbors with a per-call search width
+///
+/// Same as `chassis_search()`, but `ef` overrides the index's configured
+/// `ef_search` for this call only.
+///
+/// # Arguments
+///
+/// - `ptr`: Non-NULL pointer to index (shared access allowed)
+/// - `query`: Pointer to query vector (must not be NULL)
+/// - `len`: Number of elements in query (must match index dimensions)
+/// - `k`: Number of neighbors to find (must be > 0)
+/// - `ef`: Candidate list size (raised to `k` if smaller); `0` uses the
+///   index's `ef_search`
+/// - `out_ids`: Output buffer for vector IDs (must have space for k elements)
+/// - `out_dists`: Output buffer for distances (must have space for k elements)
+///
+/// # Returns
+///
+/// - Number of results found (≤ k) on success
+/// - 0 on failure (check `chassis_last_error_message()`)
+///
+/// # Thread Safety
+///
+/// **MULTI-READER**: Same as `chassis_search()`.
+///
+/// # Example (C)
+///
+/// ```c
+/// // Higher recall for this query only
+/// size_t count = chassis_search_with_ef(index, query, 768, 10, 400, ids, dists);
+/// ```
+///
+/// # Safety
+///
+/// - `ptr` must be non-NULL and valid
+/// - `query` must point to `len` valid f32 values
+/// - `out_ids` must have space for at least `k` u64 values
+/// - `out_dists` must have space for at least `k` float values
+/// - Buffers must not overlap
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn chassis_search_with_ef(
+    ptr: *const ChassisIndex,
+    query: *const c_float,
+    len: size_t,
+    k: size_t,
+    ef: size_t,
+    out_ids: *mut u64,
+    out_dists: *mut c_float,
 ) -> size_t {
     ffi_guard(|| {
         // SAFETY: Caller guarantees ptr is valid (shared access)
@@ -601,7 +658,13 @@ pub unsafe extern "C" fn chassis_search(
         // SAFETY: Caller guarantees query points to len valid f32 values
         let query_slice = unsafe { slice::from_raw_parts(query, len) };
 
-        match index.search(query_slice, k) {
+        let results = if ef == 0 {
+            index.search(query_slice, k)
+        } else {
+            index.search_with_ef(query_slice, k, ef)
+        };
+
+        match results {
             Ok(results) => {
                 let count = results.len();
 
@@ -625,6 +688,214 @@ pub unsafe extern "C" fn chassis_search(
     .unwrap_or(0)
 }
 
+/// Search for k nearest neighbors of multiple queries in one call (row-major layout)
+///
+/// # Arguments
+///
+/// - `ptr`: Non-NULL pointer to index (shared access allowed)
+/// - `queries`: Contiguous `num_queries * dim` floats: query `i` is
+///   `queries[i*dim .. (i+1)*dim]`
+/// - `num_queries`: Number of queries
+/// - `dim`: Elements per query (must match index dimensions)
+/// - `k`: Number of neighbors to find per query (must be > 0)
+/// - `ef`: Candidate list size per query (raised to `k` if smaller); `0`
+///   uses the index's `ef_search`
+/// - `out_ids`: Output buffer of `num_queries * k` vector IDs (row-major)
+/// - `out_dists`: Output buffer of `num_queries * k` distances (row-major)
+///
+/// # Returns
+///
+/// - Number of queries successfully processed
+/// - On first error, stops and returns the count processed so far; use
+///   `chassis_last_error_message()` for the reason
+/// - If `num_queries == 0`, returns `0` and succeeds (pointers need not be valid)
+///
+/// # Output Format
+///
+/// Row `i` holds the results for query `i`, sorted by distance (ascending).
+/// If fewer than `k` neighbors are found, the remaining slots of the row are
+/// padded with `UINT64_MAX` IDs and `INFINITY` distances.
+///
+/// # Thread Safety
+///
+/// **MULTI-READER**: Same as `chassis_search()`.
+///
+/// # Performance Note
+///
+/// Amortizes FFI overhead across many queries. Large batches are split
+/// into contiguous blocks of rows and searched on scoped worker threads
+/// (up to the available parallelism); small batches run on the calling
+/// thread.
+///
+/// # Example (C)
+///
+/// ```c
+/// float *queries; // 100 * 768 elements, row-major
+/// uint64_t ids[100 * 10];
+/// float dists[100 * 10];
+/// size_t n = chassis_search_batch(index, queries, 100, 768, 10, 0, ids, dists);
+/// if (n < 100) {
+///     fprintf(stderr, "Batch search failed: %s\n", chassis_last_error_message());
+/// }
+/// ```
+///
+/// # Safety
+///
+/// - `ptr` must be non-NULL and valid
+/// - If `num_queries > 0`, `queries` must point to `num_queries * dim` valid floats
+/// - `out_ids` and `out_dists` must each have space for `num_queries * k` values
+/// - Buffers must not overlap
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn chassis_search_batch(
+    ptr: *const ChassisIndex,
+    queries: *const c_float,
+    num_queries: size_t,
+    dim: size_t,
+    k: size_t,
+    ef: size_t,
+    out_ids: *mut u64,
+    out_dists: *mut c_float,
+) -> size_t {
+    ffi_guard(|| {
+        // SAFETY: Caller guarantees ptr is valid (shared access)
+        let state = unsafe { (ptr as *const ChassisIndexState).as_ref() };
+        let index = match state {
+            Some(s) => &s.inner,
+            None => {
+                set_last_error("Null index pointer");
+                return 0;
+            }
+        };
+
+        if num_queries == 0 {
+            clear_last_error();
+            return 0;
+        }
+
+        if queries.is_null() || out_ids.is_null() || out_dists.is_null() {
+            set_last_error("Null buffer pointers");
+            return 0;
+        }
+
+        if k == 0 {
+            set_last_error("k must be > 0");
+            return 0;
+        }
+
+        let index_dim = index.dimensions() as usize;
+        if dim != index_dim {
+            set_last_error(format!(
+                "Query dimension mismatch: expected {}, got {}",
+                index_dim, dim
+            ));
+            return 0;
+        }
+
+        let (total, total_out) = match (dim.checked_mul(num_queries), k.checked_mul(num_queries)) {
+            (Some(t), Some(o)) => (t, o),
+            _ => {
+                set_last_error("Query batch size overflow");
+                return 0;
+            }
+        };
+
+        // SAFETY: Caller guarantees `queries` points to at least `total` floats
+        let data = unsafe { slice::from_raw_parts(queries, total) };
+        // SAFETY: Caller guarantees both output buffers hold `total_out` values
+        let ids = unsafe { slice::from_raw_parts_mut(out_ids, total_out) };
+        let dists = unsafe { slice::from_raw_parts_mut(out_dists, total_out) };
+
+        let threads = std::thread::available_parallelism()
+            .map_or(1, |n| n.get())
+            .min(num_queries / MIN_QUERIES_PER_THREAD)
+            .max(1);
+
+        let result = if threads == 1 {
+            search_rows(index, data, ids, dists, dim, k, ef)
+        } else {
+            // Each worker gets a disjoint block of query rows and the
+            // matching output rows, so no synchronization is needed
+            let rows_per_thread = num_queries.div_ceil(threads);
+            std::thread::scope(|s| {
+                let workers: Vec<_> = data
+                    .chunks(rows_per_thread * dim)
+                    .zip(ids.chunks_mut(rows_per_thread * k))
+                    .zip(dists.chunks_mut(rows_per_thread * k))
+                    .enumerate()
+                    .map(|(t, ((queries, ids), dists))| {
+                        s.spawn(move || {
+                            search_rows(index, queries, ids, dists, dim, k, ef)
+                                .map_err(|(row, e)| (t * rows_per_thread + row, e))
+                        })
+                    })
+                    .collect();
+
+                // Report the earliest failing query, as the single-threaded
+                // path does. Worker panics are re-raised on this thread so
+                // ffi_guard catches them.
+                workers
+                    .into_iter()
+                    .map(|w| w.join().unwrap_or_else(|p| std::panic::resume_unwind(p)))
+                    .filter_map(Result::err)
+                    .min_by_key(|(row, _)| *row)
+                    .map_or(Ok(()), Err)
+            })
+        };
+
+        match result {
+            Ok(()) => {
+                clear_last_error();
+                num_queries
+            }
+            Err((row, e)) => {
+                set_last_error(e);
+                row
+            }
+        }
+    })
+    .unwrap_or(0)
+}
+
+/// Minimum number of queries per worker thread in `chassis_search_batch`
+///
+/// Below this, starting a thread costs more than the searches it takes over.
+const MIN_QUERIES_PER_THREAD: usize = 16;
+
+/// Search consecutive query rows into the matching output rows
+///
+/// `ef == 0` uses the index's configured `ef_search`. Rows with fewer than `k` results are padded with `u64::MAX` / `INFINITY`.
+/// On error, returns the index (within `queries`) of the failing row and the
+/// error message; earlier rows are already written.
+fn search_rows(
+    index: &VectorIndex,
+    queries: &[f32],
+    ids: &mut [u64],
+    dists: &mut [f32],
+    dim: usize,
+    k: usize,
+    ef: usize,
+) -> Result<(), (usize, String)> {
+    for (i, ((query, row_ids), row_dists)) in queries
+        .chunks_exact(dim)
+        .zip(ids.chunks_exact_mut(k))
+        .zip(dists.chunks_exact_mut(k))
+        .enumerate()
+    {
+        let results =
+            if ef == 0 { index.search(query, k) } else { index.search_with_ef(query, k, ef) };
+        let results = results.map_err(|e| (i, e.to_string()))?;
+
+        row_ids.fill(u64::MAX);
+        row_dists.fill(f32::INFINITY);
+        for ((id, dist), result) in row_ids.iter_mut().zip(row_dists.iter_mut()).zip(&results) {
+            *id = result.id;
+            *dist = result.distance;
+        }
+    }
+
+    Ok(())
+}
+
 /// Flush all changes to disk
 ///
 /// # Arguments
@@ -691,6 +962,64 @@ pub unsafe extern "C" fn chassis_flush(ptr: *mut ChassisIndex) -> c_int {
     .unwrap_or(-1)
 }
 
+/// Configure software prefetching during graph traversal
+///
+/// Prefetching only affects speed, never results. It is a runtime setting
+/// and is not stored in the index file. New indexes start with depth 0
+/// (off) and full vectors.
+///
+/// # Arguments
+///
+/// - `ptr`: Non-NULL pointer to index (requires exclusive access)
+/// - `depth`: Neighbors whose vectors are prefetched ahead of the distance
+///   loop (`0` disables prefetching)
+/// - `full_vector`: Non-zero to prefetch every cache line of a vector, zero
+///   to prefetch only the first
+///
+/// # Returns
+///
+/// - 0 on success
+/// - -1 on failure (check `chassis_last_error_message()`)
+///
+/// # Thread Safety
+///
+/// **SINGLE-WRITER**: No other operations (read or write) may occur during
+/// this call.
+///
+/// # Example (C)
+///
+/// ```c
+/// chassis_set_prefetch(index, 4, 1);
+/// ```
+///
+/// # Safety
+///
+/// - `ptr` must be non-NULL and valid
+/// - No other thread may access `ptr` during this call
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn chassis_set_prefetch(
+    ptr: *mut ChassisIndex,
+    depth: size_t,
+    full_vector: c_int,
+) -> c_int {
+    ffi_guard(|| {
+        // SAFETY: Caller guarantees ptr is valid and has exclusive access
+        let state = unsafe { (ptr as *mut ChassisIndexState).as_mut() };
+        let index = match state {
+            Some(s) => &mut s.inner,
+            None => {
+                set_last_error("Null index pointer");
+                return -1;
+            }
+        };
+
+        index.set_prefetch(depth, full_vector != 0);
+        clear_last_error();
+        0
+    })
+    .unwrap_or(-1)
+}
+
 //
 //  INTROSPECTION
 //
@@ -848,6 +1177,35 @@ pub extern "C" fn chassis_version() -> *const c_char {
 
     VERSION.as_ptr() as *const c_char
 }
+
+/// Get the name of the distance kernel selected on this CPU
+///
+/// # Returns
+///
+/// Pointer to NULL-terminated kernel name: `"avx2"`, `"neon"` or `"scalar"`.
+/// Selection happens at runtime and is the same for every index in the
+/// process.
+///
+/// # Lifetime
+///
+/// The returned pointer is valid for the lifetime of the program.
+/// **Do NOT** free the returned pointer.
+///
+/// # Example (C)
+///
+/// ```c
+/// printf("Distance kernel: %s\n", chassis_simd_kernel());
+/// ```
+#[unsafe(no_mangle)]
+pub extern "C" fn chassis_simd_kernel() -> *const c_char {
+    let name: &'static CStr = match chassis_core::distance::active_kernel() {
+        "avx2" => c"avx2",
+        "neon" => c"neon",
+        _ => c"scalar",
+    };
+
+    name.as_ptr()
+}
 //
 //  TESTS
 //
@@ -973,6 +1331,12 @@ mod tests {
         assert_eq!(version_str, expected, "FFI version should match Cargo.toml version");
     }
 
+    #[test]
+    fn test_ffi_simd_kernel() {
+        let kernel = unsafe { CStr::from_ptr(chassis_simd_kernel()) };
+        assert_eq!(kernel.to_str().unwrap(), chassis_core::distance::active_kernel());
+    }
+
     #[test]
     fn test_ffi_with_custom_options() {
         let (_dir, path) = temp_index_path();
@@ -1071,6 +1435,226 @@ mod tests {
         unsafe { chassis_free(ptr) };
     }
 
+    #[test]
+    fn test_ffi_search_batch() {
+        const DIM: usize = 16;
+        const K: usize = 5;
+        let (_dir, path) = temp_index_path();
+        let ptr = unsafe { chassis_open(path.as_ptr(), DIM as u32) };
+        assert!(!ptr.is_null());
+
+        for row in 0..3 {
+            let vec = [row as f32; DIM];
+            assert_eq!(unsafe { chassis_add(ptr, vec.as_ptr(), DIM) }, row as u64);
+        }
+
+        // Two queries, each identical to a stored vector
+        let mut queries = [0.0f32; 2 * DIM];
+        queries[..DIM].fill(2.0);
+
+        let mut ids = [0u64; 2 * K];
+        let mut dists = [0.0f32; 2 * K];
+        let n = unsafe {
+            chassis_search_batch(
+                ptr,
+                queries.as_ptr(),
+                2,
+                DIM,
+                K,
+                0,
+                ids.as_mut_ptr(),
+                dists.as_mut_ptr(),
+            )
+        };
+        assert_eq!(n, 2);
+        assert_eq!(ids[0], 2);
+        assert_eq!(ids[K], 0);
+
+        // Only 3 vectors exist: remaining slots are padded
+        assert!(ids[3..K].iter().all(|&id| id == u64::MAX));
+        assert!(dists[3..K].iter().all(|d| d.is_infinite()));
+
+        unsafe { chassis_free(ptr) };
+    }
+
+    #[test]
+    fn test_ffi_search_with_ef() {
+        const DIM: usize = 8;
+        let (_dir, path) = temp_index_path();
+        let ptr = unsafe { chassis_open_with_options(path.as_ptr(), DIM as u32, 8, 100, 10) };
+        assert!(!ptr.is_null());
+
+        for row in 0..100 {
+            let vec = [row as f32; DIM];
+            assert_eq!(unsafe { chassis_add(ptr, vec.as_ptr(), DIM) }, row as u64);
+        }
+
+        let query = [42.0f32; DIM];
+        let mut ids = [0u64; 5];
+        let mut dists = [0.0f32; 5];
+        let mut default_ids = [0u64; 5];
+        let mut default_dists = [0.0f32; 5];
+
+        // ef = 0 behaves like chassis_search
+        let count = unsafe {
+            chassis_search_with_ef(
+                ptr,
+                query.as_ptr(),
+                DIM,
+                5,
+                0,
+                ids.as_mut_ptr(),
+                dists.as_mut_ptr(),
+            )
+        };
+        let default_count = unsafe {
+            chassis_search(
+                ptr,
+                query.as_ptr(),
+                DIM,
+                5,
+                default_ids.as_mut_ptr(),
+                default_dists.as_mut_ptr(),
+            )
+        };
+        assert_eq!(count, default_count);
+        assert_eq!(ids, default_ids);
+
+        // A wider per-call search still returns the exact match first
+        let count = unsafe {
+            chassis_search_with_ef(
+                ptr,
+                query.as_ptr(),
+                DIM,
+                5,
+                200,
+                ids.as_mut_ptr(),
+                dists.as_mut_ptr(),
+            )
+        };
+        assert_eq!(count, 5);
+        assert_eq!(ids[0], 42);
+
+        unsafe { chassis_free(ptr) };
+    }
+
+    #[test]
+    fn test_ffi_set_prefetch() {
+        const DIM: usize = 8;
+        let (_dir, path) = temp_index_path();
+        let ptr = unsafe { chassis_open(path.as_ptr(), DIM as u32) };
+        assert!(!ptr.is_null());
+
+        for row in 0..50 {
+            let vec = [row as f32; DIM];
+            unsafe { chassis_add(ptr, vec.as_ptr(), DIM) };
+        }
+
+        let query = [10.0f32; DIM];
+        let search = |ptr: *mut ChassisIndex| {
+            let mut ids = [0u64; 5];
+            let mut dists = [0.0f32; 5];
+            let count = unsafe {
+                chassis_search(ptr, query.as_ptr(), DIM, 5, ids.as_mut_ptr(), dists.as_mut_ptr())
+            };
+            assert_eq!(count, 5);
+            ids
+        };
+
+        let expected = search(ptr);
+        for (depth, full_vector) in [(0, 0), (1, 0), (4, 1)] {
+            assert_eq!(unsafe { chassis_set_prefetch(ptr, depth, full_vector) }, 0);
+            assert_eq!(search(ptr), expected);
+        }
+
+        assert_eq!(unsafe { chassis_set_prefetch(ptr::null_mut(), 2, 1) }, -1);
+
+        unsafe { chassis_free(ptr) };
+    }
+
+    #[test]
+    fn test_ffi_search_batch_matches_single_search() {
+        // Enough queries to be split across worker threads
+        const DIM: usize = 8;
+        const K: usize = 4;
+        const NUM_QUERIES: usize = 8 * MIN_QUERIES_PER_THREAD;
+        let (_dir, path) = temp_index_path();
+        let ptr = unsafe { chassis_open(path.as_ptr(), DIM as u32) };
+        assert!(!ptr.is_null());
+
+        for row in 0..50 {
+            let vec: Vec<f32> = (0..DIM).map(|d| ((row * 7 + d) % 13) as f32).collect();
+            assert_eq!(unsafe { chassis_add(ptr, vec.as_ptr(), DIM) }, row as u64);
+        }
+
+        let queries: Vec<f32> = (0..NUM_QUERIES * DIM).map(|i| (i % 11) as f32).collect();
+        let mut ids = [0u64; NUM_QUERIES * K];
+        let mut dists = [0.0f32; NUM_QUERIES * K];
+        let n = unsafe {
+            chassis_search_batch(
+                ptr,
+                queries.as_ptr(),
+                NUM_QUERIES,
+                DIM,
+                K,
+                0,
+                ids.as_mut_ptr(),
+                dists.as_mut_ptr(),
+            )
+        };
+        assert_eq!(n, NUM_QUERIES);
+
+        // Every row matches the single-query result, in query order
+        for (q, query) in queries.chunks_exact(DIM).enumerate() {
+            let mut expected_ids = [0u64; K];
+            let mut expected_dists = [0.0f32; K];
+            let count = unsafe {
+                chassis_search(
+                    ptr,
+                    query.as_ptr(),
+                    DIM,
+                    K,
+                    expected_ids.as_mut_ptr(),
+                    expected_dists.as_mut_ptr(),
+                )
+            };
+            assert_eq!(count, K);
+            assert_eq!(&ids[q * K..(q + 1) * K], &expected_ids);
+            assert_eq!(&dists[q * K..(q + 1) * K], &expected_dists);
+        }
+
+        unsafe { chassis_free(ptr) };
+    }
+
+    #[test]
+    fn test_ffi_search_batch_dimension_mismatch() {
+        let (_dir, path) = temp_index_path();
+        let ptr = unsafe { chassis_open(path.as_ptr(), 128) };
+        assert!(!ptr.is_null());
+
+        let queries = vec![0.1f32; 64];
+        let mut ids = vec![0u64; 5];
+        let mut dists = vec![0.0f32; 5];
+        let n = unsafe {
+            chassis_search_batch(
+                ptr,
+                queries.as_ptr(),
+                1,
+                64,
+                5,
+                0,
+                ids.as_mut_ptr(),
+                dists.as_mut_ptr(),
+            )
+        };
+        assert_eq!(n, 0);
+
+        let error = unsafe { CStr::from_ptr(chassis_last_error_message()) };
+        assert!(error.to_string_lossy().to_lowercase().contains("dimension"));
+
+        unsafe { chassis_free(ptr) };
+    }
+
     #[test]
     fn test_ffi_invalid_utf8_path() {
         // Create a path with invalid UTF-8
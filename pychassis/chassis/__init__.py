@@ -14,7 +14,12 @@ Example:
     >>> index.flush()
 """
 
-from chassis.index import VectorIndex, SearchResult, IndexOptions
+from chassis.index import (
+    VectorIndex,
+    SearchResult,
+    SearchResultSet,
+    IndexOptions,
+)
 from chassis.exceptions import (
     ChassisError,
     DimensionMismatchError,
@@ -26,6 +31,7 @@ __version__ = "0.6.3"
 __all__ = [
     "VectorIndex",
     "SearchResult",
+    "SearchResultSet",
     "IndexOptions",
     "ChassisError",
     "DimensionMismatchError",
@@ -5,11 +5,15 @@ Users should use the high-level VectorIndex class instead.
 """
 
 import ctypes
+import functools
 import os
 import platform
+from ctypes.util import find_library
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 
 # Determine library name based on platform
 def _get_library_name() -> str:
@@ -25,11 +29,15 @@ def _get_library_name() -> str:
         raise RuntimeError(f"Unsupported platform: {system}")
 
 
+@functools.lru_cache(maxsize=1)
 def _find_library() -> Path:
     """Find the Chassis FFI library.
 
+    The result is cached, so the filesystem is only probed once per
+    process.
+
     Search order:
-    1. CHASSIS_LIB_PATH environment variable
+    1. CHASSIS_LIB_PATH environment variable (library file or directory)
     2. Next to this Python file (for development)
     3. ../target/release (for development)
     4. System library paths (TODO: for installed packages)
@@ -44,7 +52,10 @@ def _find_library() -> Path:
 
     # 1. Environment variable
     if env_path := os.getenv("CHASSIS_LIB_PATH"):
-        lib_path = Path(env_path) / lib_name
+        lib_path = Path(env_path)
+        if lib_path.is_file():
+            return lib_path
+        lib_path = lib_path / lib_name
         if lib_path.exists():
             return lib_path
 
@@ -60,8 +71,6 @@ def _find_library() -> Path:
         return dev_path
 
     # 4. Try system paths (ctypes.util.find_library)
-    from ctypes.util import find_library
-
     if lib_path_str := find_library("chassis_ffi"):
         return Path(lib_path_str)
 
@@ -71,7 +80,8 @@ def _find_library() -> Path:
     )
 
 
-# Load the library
+# Load the library. CDLL (unlike PyDLL) releases the GIL for the duration
+# of every foreign call, so concurrent searches run in parallel.
 _lib_path = _find_library()
 _lib = ctypes.CDLL(str(_lib_path))
 
@@ -85,6 +95,24 @@ class ChassisIndex(ctypes.Structure):
 
 ChassisIndexPtr = ctypes.POINTER(ChassisIndex)
 
+# NumPy buffer types. ctypes checks dtype, rank and contiguity when the
+# array is passed, and hands the data pointer straight to C.
+FloatArray1D = np.ctypeslib.ndpointer(
+    dtype=np.float32, ndim=1, flags="C_CONTIGUOUS"
+)
+FloatArray2D = np.ctypeslib.ndpointer(
+    dtype=np.float32, ndim=2, flags="C_CONTIGUOUS"
+)
+UInt64Array1D = np.ctypeslib.ndpointer(
+    dtype=np.uint64, ndim=1, flags="C_CONTIGUOUS"
+)
+UInt64Array2D = np.ctypeslib.ndpointer(
+    dtype=np.uint64, ndim=2, flags="C_CONTIGUOUS"
+)
+
+# Plain float pointer, for buffers whose pointer is built once and reused
+FloatPtr = ctypes.POINTER(ctypes.c_float)
+
 
 # Function signatures
 
@@ -109,26 +137,81 @@ _lib.chassis_free.restype = None
 # chassis_add
 _lib.chassis_add.argtypes = [
     ChassisIndexPtr,
-    ctypes.POINTER(ctypes.c_float),
+    FloatArray1D,
     ctypes.c_size_t,
 ]
 _lib.chassis_add.restype = ctypes.c_uint64
 
+# chassis_add taking a prebuilt FloatPtr. A separate function object so
+# its argtypes don't replace the ndpointer check on chassis_add. Skips
+# the per-call ndpointer conversion, so the caller must guarantee the
+# buffer is float32 with the right length.
+chassis_add_ptr = _lib["chassis_add"]
+chassis_add_ptr.argtypes = [
+    ChassisIndexPtr,
+    FloatPtr,
+    ctypes.c_size_t,
+]
+chassis_add_ptr.restype = ctypes.c_uint64
+
+# chassis_add_batch
+_lib.chassis_add_batch.argtypes = [
+    ChassisIndexPtr,
+    FloatArray2D,
+    ctypes.c_size_t,
+    ctypes.c_size_t,
+    UInt64Array1D,
+]
+_lib.chassis_add_batch.restype = ctypes.c_size_t
+
 # chassis_search
 _lib.chassis_search.argtypes = [
     ChassisIndexPtr,
-    ctypes.POINTER(ctypes.c_float),
+    FloatArray1D,
     ctypes.c_size_t,
     ctypes.c_size_t,
-    ctypes.POINTER(ctypes.c_uint64),
-    ctypes.POINTER(ctypes.c_float),
+    UInt64Array1D,
+    FloatArray1D,
 ]
 _lib.chassis_search.restype = ctypes.c_size_t
 
+# chassis_search_with_ef
+_lib.chassis_search_with_ef.argtypes = [
+    ChassisIndexPtr,
+    FloatArray1D,
+    ctypes.c_size_t,
+    ctypes.c_size_t,
+    ctypes.c_size_t,
+    UInt64Array1D,
+    FloatArray1D,
+]
+_lib.chassis_search_with_ef.restype = ctypes.c_size_t
+
+# chassis_search_batch
+_lib.chassis_search_batch.argtypes = [
+    ChassisIndexPtr,
+    FloatArray2D,
+    ctypes.c_size_t,
+    ctypes.c_size_t,
+    ctypes.c_size_t,
+    ctypes.c_size_t,
+    UInt64Array2D,
+    FloatArray2D,
+]
+_lib.chassis_search_batch.restype = ctypes.c_size_t
+
 # chassis_flush
 _lib.chassis_flush.argtypes = [ChassisIndexPtr]
 _lib.chassis_flush.restype = ctypes.c_int
 
+# chassis_set_prefetch
+_lib.chassis_set_prefetch.argtypes = [
+    ChassisIndexPtr,
+    ctypes.c_size_t,  # depth
+    ctypes.c_int,  # full_vector
+]
+_lib.chassis_set_prefetch.restype = ctypes.c_int
+
 # chassis_len
 _lib.chassis_len.argtypes = [ChassisIndexPtr]
 _lib.chassis_len.restype = ctypes.c_uint64
@@ -149,6 +232,10 @@ _lib.chassis_last_error_message.restype = ctypes.c_char_p
 _lib.chassis_version.argtypes = []
 _lib.chassis_version.restype = ctypes.c_char_p
 
+# chassis_simd_kernel
+_lib.chassis_simd_kernel.argtypes = []
+_lib.chassis_simd_kernel.restype = ctypes.c_char_p
+
 
 # Helper functions
 
@@ -175,6 +262,15 @@ def get_version() -> str:
     return version_ptr.decode("utf-8")
 
 
+def get_simd_kernel() -> str:
+    """Get the distance kernel the library selected for this CPU.
+
+    Returns:
+        Kernel name: "avx2", "neon" or "scalar"
+    """
+    return _lib.chassis_simd_kernel().decode("utf-8")
+
+
 # Export public interface
 __all__ = [
     "_lib",
@@ -182,4 +278,5 @@ __all__ = [
     "ChassisIndexPtr",
     "get_last_error",
     "get_version",
+    "get_simd_kernel",
 ]
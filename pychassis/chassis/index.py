@@ -1,9 +1,17 @@
 """High-level Pythonic interface to Chassis vector index."""
 
-import ctypes
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
 import numpy as np
 import numpy.typing as npt
@@ -28,11 +36,18 @@ class IndexOptions:
             Higher = better index quality, slower build. Default: 200
         ef_search: Search quality parameter.
             Higher = better search quality, slower search. Default: 50
+        prefetch_depth: Neighbors whose vectors are prefetched ahead of
+            the distance loop during search. 0 disables prefetching.
+            Affects speed only, not results. Default: 0
+        prefetch_full_vector: Prefetch every cache line of a vector
+            instead of only the first. Default: True
     """
 
     max_connections: int = 16
     ef_construction: int = 200
     ef_search: int = 50
+    prefetch_depth: int = 0
+    prefetch_full_vector: bool = True
 
     def validate(self) -> None:
         """Validate configuration parameters.
@@ -50,12 +65,18 @@ class IndexOptions:
             )
         if self.ef_search < 1:
             raise ValueError(f"ef_search must be >= 1, got {self.ef_search}")
+        if self.prefetch_depth < 0:
+            raise ValueError(
+                f"prefetch_depth must be >= 0, got {self.prefetch_depth}"
+            )
 
 
-@dataclass
-class SearchResult:
+class SearchResult(NamedTuple):
     """A single search result.
 
+    A named tuple, so results are cheap to create, immutable and can be
+    unpacked: ``for id_, distance in index.search(query, k)``.
+
     Attributes:
         id: Vector ID in the index
         distance: Distance to the query vector (lower is closer)
@@ -68,6 +89,77 @@ class SearchResult:
         return f"SearchResult(id={self.id}, distance={self.distance:.6f})"
 
 
+class SearchResultSet(Sequence[SearchResult]):
+    """Results of a single search, backed by NumPy arrays.
+
+    Behaves like a read-only list of SearchResult objects, but only
+    creates them when an element is accessed. Code that works on arrays
+    can use ids and distances directly without any conversion.
+
+    Attributes:
+        ids: Vector IDs (uint64), sorted by distance (ascending)
+        distances: Distances to the query (float32), same order as ids
+    """
+
+    __slots__ = ("ids", "distances")
+
+    def __init__(
+        self,
+        ids: npt.NDArray[np.uint64],
+        distances: npt.NDArray[np.float32],
+    ):
+        self.ids = ids
+        self.distances = distances
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> SearchResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "SearchResultSet": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[SearchResult, "SearchResultSet"]:
+        if isinstance(index, slice):
+            return SearchResultSet(self.ids[index], self.distances[index])
+        return SearchResult(int(self.ids[index]), float(self.distances[index]))
+
+    def __iter__(self) -> Iterator[SearchResult]:
+        # Positional construction skips keyword parsing for each result
+        return map(SearchResult, self.ids.tolist(), self.distances.tolist())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SearchResultSet({list(self)!r})"
+
+
+def _check_out_buffer(
+    name: str, out: Any, shape: Tuple[int, ...], dtype: type
+) -> None:
+    """Check that a caller-supplied output array can be written by the FFI.
+
+    Raises:
+        ValueError: If out is not a writeable C-contiguous array of the
+            given shape and dtype
+    """
+    if not isinstance(out, np.ndarray):
+        raise ValueError(f"{name} must be a numpy array")
+    if out.dtype != dtype or out.shape != shape:
+        raise ValueError(
+            f"{name} must have dtype {np.dtype(dtype)} and shape {shape}, "
+            f"got {out.dtype} and {out.shape}"
+        )
+    if not (out.flags.c_contiguous and out.flags.writeable):
+        raise ValueError(f"{name} must be C-contiguous and writeable")
+
+
 class VectorIndex:
     """High-level interface to Chassis vector index.
 
@@ -78,6 +170,8 @@ class VectorIndex:
         - add() and flush() require exclusive access (single writer)
         - search(), len(), is_empty(), dimensions() allow concurrent
             access (multi reader)
+        - The GIL is released while the Rust library runs, so concurrent
+            searches from multiple threads scale across cores
 
     Example:
         >>> index = VectorIndex("vectors.chassis", dimensions=128)
@@ -113,12 +207,14 @@ class VectorIndex:
             NullPointerError: If index creation fails
             ChassisError: For other errors
         """
+        # Set first so close() and __del__ work even if __init__ fails.
+        # The index is closed exactly when _ptr is None.
+        self._ptr: Optional[_ffi.ChassisIndexPtr] = None
         self._path = Path(path)
         self._dimensions = dimensions
+        self._vector_shape = (dimensions,)
         self._options = options or IndexOptions()
         self._options.validate()
-        self._ptr: Optional[_ffi.ChassisIndexPtr] = None
-        self._closed = False
 
         # Encode path to UTF-8 bytes
         path_bytes = str(self._path).encode("utf-8")
@@ -155,6 +251,45 @@ class VectorIndex:
 
         self._ptr = ptr
 
+        # Prefetching is a runtime setting, not stored in the file
+        if options is not None:
+            result = _ffi._lib.chassis_set_prefetch(
+                ptr, options.prefetch_depth, int(options.prefetch_full_vector)
+            )
+            if result != 0:
+                error_msg = _ffi.get_last_error()
+                raise ChassisError(
+                    f"Failed to set prefetch: {error_msg or 'unknown error'}"
+                )
+
+        # Bind hot-path FFI functions once to skip the module attribute
+        # chain on every call
+        self._c_add_batch = _ffi._lib.chassis_add_batch
+        self._c_search = _ffi._lib.chassis_search_with_ef
+        self._c_search_batch = _ffi._lib.chassis_search_batch
+        self._c_flush = _ffi._lib.chassis_flush
+
+        # Specialize add() for this index: the handle, dimensions and
+        # staging buffer never change, so bind them into closures once
+        # instead of loading them from self on every call. Callers must
+        # check that the index is still open first.
+        c_add = _ffi._lib.chassis_add
+        c_add_ptr = _ffi.chassis_add_ptr
+        scratch = np.empty(dimensions, dtype=np.float32)
+        scratch_p = scratch.ctypes.data_as(_ffi.FloatPtr)
+
+        def add_array(vector: npt.NDArray[np.float32]) -> int:
+            return c_add(ptr, vector, dimensions)
+
+        def add_sequence(vector: Sequence[float]) -> int:
+            # Stage in the reusable buffer; its dtype and shape are fixed,
+            # so pass the prebuilt pointer and skip the ndpointer check
+            scratch[:] = vector
+            return c_add_ptr(ptr, scratch_p, dimensions)
+
+        self._add_array = add_array
+        self._add_sequence = add_sequence
+
     def __del__(self):
         """Clean up resources when index is garbage collected."""
         self.close()
@@ -174,15 +309,10 @@ class VectorIndex:
         This is called automatically when the object is garbage collected
         or when used as a context manager. It's safe to call multiple times.
         """
-        if not self._closed and self._ptr:
-            _ffi._lib.chassis_free(self._ptr)
+        ptr = self._ptr
+        if ptr is not None:
             self._ptr = None
-            self._closed = True
-
-    def _check_closed(self) -> None:
-        """Check if index is closed and raise error if so."""
-        if self._closed or not self._ptr:
-            raise ChassisError("Index is closed")
+            _ffi._lib.chassis_free(ptr)
 
     def add(
         self, vector: Union[Sequence[float], npt.NDArray[np.float32]]
@@ -207,33 +337,111 @@ class VectorIndex:
 
         Thread Safety:
             Single-writer only. Do not call concurrently with other add()
-            or flush() calls.
+            or flush() calls. List and tuple input is staged in a buffer
+            owned by the index, which relies on this guarantee.
         """
-        self._check_closed()
+        if self._ptr is None:
+            raise ChassisError("Index is closed")
+
+        # Dispatch on the exact type: two identity checks are cheaper than
+        # isinstance() against a tuple of classes. Subclasses take the
+        # general path below, which handles them correctly.
+        vector_id = None
+        vector_type = type(vector)
+        if (vector_type is list or vector_type is tuple) and len(
+            vector
+        ) == self._dimensions:
+            # Python sequences are copied into a buffer owned by the index
+            # instead of allocating a new array per call
+            try:
+                vector_id = self._add_sequence(vector)
+            except ValueError:
+                # Nested elements don't fit the staging buffer; fall
+                # through so the shape check below reports them
+                pass
+        if vector_id is None:
+            # Convert to a C-contiguous float32 array (no-op if it already is)
+            vector = np.ascontiguousarray(vector, dtype=np.float32)
+
+            # Validate dimensions (one tuple compare also rejects ndim != 1)
+            shape = self._vector_shape
+            if vector.shape != shape:
+                raise DimensionMismatchError(
+                    f"Vector has shape {vector.shape}, "
+                    f"but index expects {shape}"
+                )
+
+            # Call FFI (argtypes check dtype and layout and pass the buffer)
+            vector_id = self._add_array(vector)
 
-        # Convert to numpy array for consistent handling
-        if not isinstance(vector, np.ndarray):
-            vector = np.array(vector, dtype=np.float32)
-        elif vector.dtype != np.float32:
-            vector = vector.astype(np.float32)
+        # Check for error (UINT64_MAX)
+        if vector_id == 2**64 - 1:
+            error_msg = _ffi.get_last_error()
+            if error_msg:
+                if "dimension" in error_msg.lower():
+                    raise DimensionMismatchError(error_msg)
+                else:
+                    raise ChassisError(error_msg)
+            else:
+                raise ChassisError("Failed to add vector")
+
+        return int(vector_id)
+
+    def add_many(
+        self,
+        vectors: Union[Sequence[Sequence[float]], npt.NDArray[np.float32]],
+    ) -> npt.NDArray[np.uint64]:
+        """Add a batch of vectors to the index in a single FFI call.
 
-        # Validate dimensions
-        if len(vector) != self._dimensions:
+        Prefer this over calling add() in a loop: the dtype conversion,
+        dimension check and FFI crossing happen once per batch instead of
+        once per vector.
+
+        Args:
+            vectors: 2D array of shape (N, dimensions), one vector per row.
+                Converted to a C-contiguous float32 array if necessary.
+
+        Returns:
+            Array of N vector IDs (uint64), in row order
+
+        Raises:
+            ChassisError: If index is closed
+            DimensionMismatchError: If rows don't match index dimensions
+            ChassisError: For other errors. Rows before the failing one
+                have already been inserted.
+
+        Note:
+            This method does NOT guarantee durability. Call flush() to
+            ensure data is written to disk.
+
+        Thread Safety:
+            Single-writer only. Do not call concurrently with add(),
+            add_many() or flush() calls.
+        """
+        ptr = self._ptr
+        if ptr is None:
+            raise ChassisError("Index is closed")
+        dim = self._dimensions
+
+        # Single conversion pass for the whole batch (no-op if already
+        # C-contiguous float32)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+        # Validate dimensions once
+        shape = vectors.shape
+        if len(shape) != 2 or shape[1] != dim:
             raise DimensionMismatchError(
-                f"Vector has {len(vector)} dimensions, "
-                f"but index expects {self._dimensions}"
+                f"Batch has shape {shape}, but index expects (N, {dim})"
             )
 
-        # Ensure C-contiguous array
-        if not vector.flags.c_contiguous:
-            vector = np.ascontiguousarray(vector)
+        count = shape[0]
+        out_ids = np.empty(count, dtype=np.uint64)
 
         # Call FFI
-        vector_ptr = vector.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
-        vector_id = _ffi._lib.chassis_add(self._ptr, vector_ptr, len(vector))
+        inserted = self._c_add_batch(ptr, vectors, count, dim, out_ids)
 
-        # Check for error (UINT64_MAX)
-        if vector_id == 2**64 - 1:
+        # Fewer rows than requested means the batch stopped on an error
+        if inserted != count:
             error_msg = _ffi.get_last_error()
             if error_msg:
                 if "dimension" in error_msg.lower():
@@ -241,72 +449,109 @@ class VectorIndex:
                 else:
                     raise ChassisError(error_msg)
             else:
-                raise ChassisError("Failed to add vector")
+                raise ChassisError(
+                    f"Failed to add batch ({inserted}/{count} inserted)"
+                )
 
-        return int(vector_id)
+        return out_ids
 
     def search(
         self,
         query: Union[Sequence[float], npt.NDArray[np.float32]],
         k: int = 10,
-    ) -> List[SearchResult]:
+        ef: Optional[int] = None,
+    ) -> SearchResultSet:
         """Search for k nearest neighbors.
 
         Args:
             query: Query vector (must match index dimensions)
             k: Number of nearest neighbors to return (default: 10)
+            ef: Candidate list size for this call only, overriding
+                options.ef_search (raised to k if smaller). None uses the
+                index's configured ef_search.
 
         Returns:
-            List of SearchResult objects, sorted by distance (ascending)
+            SearchResultSet, sorted by distance (ascending). Iterating or
+            indexing it yields SearchResult objects; its ids and distances
+            attributes expose the underlying NumPy arrays.
 
         Raises:
             ChassisError: If index is closed
             DimensionMismatchError: If query dimensions don't match
-            ValueError: If k < 1
+            ValueError: If k < 1 or ef < 1
             ChassisError: For other errors
 
         Thread Safety:
             Multi-reader safe. Can be called concurrently with other search()
             calls, but not with add() or flush().
         """
-        self._check_closed()
+        ids, dists = self.search_arrays(query, k, ef)
+
+        # SearchResult objects are only built when the caller asks
+        return SearchResultSet(ids, dists)
+
+    def search_arrays(
+        self,
+        query: Union[Sequence[float], npt.NDArray[np.float32]],
+        k: int = 10,
+        ef: Optional[int] = None,
+    ) -> Tuple[npt.NDArray[np.uint64], npt.NDArray[np.float32]]:
+        """Search for k nearest neighbors, returning raw NumPy arrays.
+
+        Same as search(), but returns the FFI output buffers directly
+        instead of building one SearchResult per neighbor. Use this on
+        throughput-sensitive paths or when the results feed further
+        NumPy code.
+
+        Args:
+            query: Query vector (must match index dimensions)
+            k: Number of nearest neighbors to return (default: 10)
+            ef: Candidate list size for this call only, overriding
+                options.ef_search (raised to k if smaller). None uses the
+                index's configured ef_search.
+
+        Returns:
+            Tuple (ids, distances) of equal length (<= k), sorted by
+            distance (ascending). ids is uint64, distances is float32.
+
+        Raises:
+            ChassisError: If index is closed
+            DimensionMismatchError: If query dimensions don't match
+            ValueError: If k < 1 or ef < 1
+            ChassisError: For other errors
+
+        Thread Safety:
+            Multi-reader safe. Can be called concurrently with other search()
+            calls, but not with add() or flush().
+        """
+        ptr = self._ptr
+        if ptr is None:
+            raise ChassisError("Index is closed")
 
         if k < 1:
             raise ValueError(f"k must be >= 1, got {k}")
+        if ef is None:
+            ef = 0  # The library falls back to options.ef_search
+        elif ef < 1:
+            raise ValueError(f"ef must be >= 1, got {ef}")
 
-        # Convert to numpy array
-        if not isinstance(query, np.ndarray):
-            query = np.array(query, dtype=np.float32)
-        elif query.dtype != np.float32:
-            query = query.astype(np.float32)
+        # Convert to a C-contiguous float32 array (no-op if it already is)
+        query = np.ascontiguousarray(query, dtype=np.float32)
 
-        # Validate dimensions
-        if len(query) != self._dimensions:
+        # Validate dimensions (one tuple compare also rejects ndim != 1)
+        shape = self._vector_shape
+        if query.shape != shape:
             raise DimensionMismatchError(
-                f"Query has {len(query)} dimensions, "
-                f"but index expects {self._dimensions}"
+                f"Query has shape {query.shape}, but index expects {shape}"
             )
 
-        # Ensure C-contiguous
-        if not query.flags.c_contiguous:
-            query = np.ascontiguousarray(query)
-
-        # Allocate output buffers
-        out_ids = np.zeros(k, dtype=np.uint64)
-        out_dists = np.zeros(k, dtype=np.float32)
+        # Allocate output buffers (only the first `count` entries are read)
+        out_ids = np.empty(k, dtype=np.uint64)
+        out_dists = np.empty(k, dtype=np.float32)
 
         # Call FFI
-        query_ptr = query.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
-        ids_ptr = out_ids.ctypes.data_as(ctypes.POINTER(ctypes.c_uint64))
-        dists_ptr = out_dists.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
-
-        count = _ffi._lib.chassis_search(
-            self._ptr,
-            query_ptr,
-            len(query),
-            k,
-            ids_ptr,
-            dists_ptr,
+        count = self._c_search(
+            ptr, query, self._dimensions, k, ef, out_ids, out_dists
         )
 
         # Check for error (count == 0 could be error or empty index)
@@ -319,13 +564,115 @@ class VectorIndex:
                     raise ChassisError(error_msg)
             # Otherwise, just no results (empty index or no neighbors found)
 
-        # Convert to SearchResult objects
-        results = [
-            SearchResult(id=int(out_ids[i]), distance=float(out_dists[i]))
-            for i in range(count)
-        ]
+        # Views into the output buffers, no copy
+        return out_ids[:count], out_dists[:count]
+
+    def search_many(
+        self,
+        queries: Union[Sequence[Sequence[float]], npt.NDArray[np.float32]],
+        k: int = 10,
+        ef: Optional[int] = None,
+        out_ids: Optional[npt.NDArray[np.uint64]] = None,
+        out_dists: Optional[npt.NDArray[np.float32]] = None,
+    ) -> Tuple[npt.NDArray[np.uint64], npt.NDArray[np.float32]]:
+        """Search for k nearest neighbors of a batch of queries.
+
+        All queries are answered with a single FFI call, which avoids
+        paying the per-call overhead of search() once per query. Large
+        batches are split across threads inside the library.
 
-        return results
+        Like NumPy's ``out=`` arguments, out_ids and out_dists let a
+        caller that searches repeatedly reuse the same result buffers
+        instead of allocating new ones on every call.
+
+        Args:
+            queries: 2D array of shape (Q, dimensions), one query per row.
+                Converted to a C-contiguous float32 array if necessary.
+            k: Number of nearest neighbors to return per query (default: 10)
+            ef: Candidate list size for this call only, overriding
+                options.ef_search (raised to k if smaller). None uses the
+                index's configured ef_search.
+            out_ids: Optional C-contiguous, writeable uint64 array of
+                shape (Q, k) to write the ids into. Allocated if None.
+            out_dists: Optional C-contiguous, writeable float32 array of
+                shape (Q, k) to write the distances into. Allocated if
+                None.
+
+        Returns:
+            Tuple (ids, distances) of arrays with shape (Q, k). Row i holds
+            the results for query i, sorted by distance (ascending). If
+            fewer than k neighbors are found, the row is padded with
+            ids of 2**64 - 1 and distances of inf. These are out_ids and
+            out_dists themselves when given.
+
+        Raises:
+            ChassisError: If index is closed
+            DimensionMismatchError: If query dimensions don't match
+            ValueError: If k < 1, ef < 1, or an output buffer has the
+                wrong dtype, shape or layout
+            ChassisError: For other errors
+
+        Thread Safety:
+            Multi-reader safe. Can be called concurrently with other search()
+            calls, but not with add() or flush().
+        """
+        ptr = self._ptr
+        if ptr is None:
+            raise ChassisError("Index is closed")
+
+        if k < 1:
+            raise ValueError(f"k must be >= 1, got {k}")
+        if ef is None:
+            ef = 0  # The library falls back to options.ef_search
+        elif ef < 1:
+            raise ValueError(f"ef must be >= 1, got {ef}")
+
+        # Single conversion pass for the whole batch
+        queries = np.ascontiguousarray(queries, dtype=np.float32)
+
+        # Validate dimensions once
+        dim = self._dimensions
+        shape = queries.shape
+        if len(shape) != 2 or shape[1] != dim:
+            raise DimensionMismatchError(
+                f"Queries have shape {shape}, but index expects (Q, {dim})"
+            )
+
+        num_queries = shape[0]
+        out_shape = (num_queries, k)
+        if out_ids is None:
+            out_ids = np.empty(out_shape, dtype=np.uint64)
+        else:
+            _check_out_buffer("out_ids", out_ids, out_shape, np.uint64)
+        if out_dists is None:
+            out_dists = np.empty(out_shape, dtype=np.float32)
+        else:
+            _check_out_buffer("out_dists", out_dists, out_shape, np.float32)
+
+        # Call FFI
+        processed = self._c_search_batch(
+            ptr,
+            queries,
+            num_queries,
+            dim,
+            k,
+            ef,
+            out_ids,
+            out_dists,
+        )
+
+        # Fewer queries than requested means the batch stopped on an error
+        if processed != num_queries:
+            error_msg = _ffi.get_last_error()
+            if error_msg:
+                if "dimension" in error_msg.lower():
+                    raise DimensionMismatchError(error_msg)
+                else:
+                    raise ChassisError(error_msg)
+            else:
+                raise ChassisError("Batch search failed")
+
+        return out_ids, out_dists
 
     def flush(self) -> None:
         """Flush all changes to disk.
@@ -340,9 +687,11 @@ class VectorIndex:
             Single-writer only. Do not call concurrently with add() or other
             flush() calls.
         """
-        self._check_closed()
+        ptr = self._ptr
+        if ptr is None:
+            raise ChassisError("Index is closed")
 
-        result = _ffi._lib.chassis_flush(self._ptr)
+        result = self._c_flush(ptr)
 
         if result != 0:
             error_msg = _ffi.get_last_error()
@@ -357,8 +706,10 @@ class VectorIndex:
         Thread Safety:
             Multi-reader safe.
         """
-        self._check_closed()
-        return int(_ffi._lib.chassis_len(self._ptr))
+        ptr = self._ptr
+        if ptr is None:
+            raise ChassisError("Index is closed")
+        return int(_ffi._lib.chassis_len(ptr))
 
     def is_empty(self) -> bool:
         """Check if the index is empty.
@@ -369,8 +720,10 @@ class VectorIndex:
         Thread Safety:
             Multi-reader safe.
         """
-        self._check_closed()
-        return bool(_ffi._lib.chassis_is_empty(self._ptr))
+        ptr = self._ptr
+        if ptr is None:
+            raise ChassisError("Index is closed")
+        return bool(_ffi._lib.chassis_is_empty(ptr))
 
     @property
     def dimensions(self) -> int:
@@ -382,8 +735,10 @@ class VectorIndex:
         Thread Safety:
             Multi-reader safe.
         """
-        self._check_closed()
-        return int(_ffi._lib.chassis_dimensions(self._ptr))
+        ptr = self._ptr
+        if ptr is None:
+            raise ChassisError("Index is closed")
+        return int(_ffi._lib.chassis_dimensions(ptr))
 
     @property
     def path(self) -> Path:
@@ -396,10 +751,10 @@ class VectorIndex:
         return self._options
 
     def __repr__(self) -> str:
-        status = "closed" if self._closed else "open"
+        closed = self._ptr is None
         return (
             f"VectorIndex(path={self._path}, "
             f"dimensions={self._dimensions}, "
-            f"len={len(self) if not self._closed else '?'}, "
-            f"status={status})"
+            f"len={'?' if closed else len(self)}, "
+            f"status={'closed' if closed else 'open'})"
         )
@@ -0,0 +1,73 @@
+"""Helpers for preparing data before it is inserted into an index.
+
+Example:
+    >>> from chassis.util import morton_sort
+    >>> order = morton_sort(vectors)
+    >>> ids = index.add_many(vectors[order])
+    >>> # ids[i] is the index ID of vectors[order[i]]
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+# Bits per axis in a 3D Morton key; 3 * 21 = 63 bits fit in a uint64
+_MORTON_BITS = 21
+_MORTON_MAX = (1 << _MORTON_BITS) - 1
+
+
+def _spread_bits(x: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    """Insert two zero bits between each of the low 21 bits of x."""
+    x = x & np.uint64(0x1FFFFF)
+    x = (x | (x << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+    x = (x | (x << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+    x = (x | (x << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+    x = (x | (x << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+    x = (x | (x << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return x
+
+
+def morton_sort(vectors: npt.ArrayLike) -> npt.NDArray[np.intp]:
+    """Order vectors along a 3D Morton (Z-order) curve.
+
+    Inserting vectors in this order places vectors that are close in
+    their first three dimensions next to each other in the index file,
+    so graph traversal touches fewer distinct pages during bulk builds.
+    Each of the first three columns is scaled to 21 bits over its own
+    range and the bits are interleaved into a 63-bit key.
+
+    Index IDs follow insertion order, so keep the returned permutation
+    to map IDs back to rows of the original array.
+
+    Args:
+        vectors: 2D array of shape (N, D). Only the first three columns
+            are used; missing columns (D < 3) count as zero.
+
+    Returns:
+        Permutation of range(N) as an intp array, such that
+        vectors[order] is sorted by Morton key. Ties keep their input
+        order.
+
+    Raises:
+        ValueError: If vectors is not 2D
+    """
+    vectors = np.asarray(vectors, dtype=np.float64)
+    if vectors.ndim != 2:
+        raise ValueError(
+            f"vectors must be 2D (N, D), got shape {vectors.shape}"
+        )
+
+    coords = vectors[:, :3]
+    low = coords.min(axis=0, initial=np.inf)
+    span = coords.max(axis=0, initial=-np.inf) - low
+    # Constant columns map to 0 instead of dividing by zero
+    span[span == 0] = 1.0
+    grid = ((coords - low) / span * _MORTON_MAX).astype(np.uint64)
+
+    key = np.zeros(len(vectors), dtype=np.uint64)
+    for axis in range(grid.shape[1]):
+        key |= _spread_bits(grid[:, axis]) << np.uint64(axis)
+
+    return np.argsort(key, kind="stable").astype(np.intp, copy=False)
+
+
+__all__ = ["morton_sort"]
@@ -22,11 +22,11 @@ def main():
 
     # Add some vectors
     print("\n2. Adding vectors...")
-    np.random.seed(42)  # For reproducibility
+    rng = np.random.default_rng(42)  # For reproducibility
 
     for i in range(20):
         # Generate a random vector
-        vector = np.random.rand(128).astype(np.float32)
+        vector = rng.random(128, dtype=np.float32)
 
         # Add to index
         vector_id = index.add(vector)
@@ -43,7 +43,7 @@ def main():
 
     # Search for nearest neighbors
     print("\n4. Searching for nearest neighbors...")
-    query = np.random.rand(128).astype(np.float32)
+    query = rng.random(128, dtype=np.float32)
     results = index.search(query, k=5)
 
     print(f"   Found {len(results)} neighbors:")
@@ -34,6 +34,13 @@ def main():
     with VectorIndex("batch_example.chassis", dimensions=DIMENSIONS) as index:
         print(f"Index created: {index.path}")
 
+        # Generate all vectors up front so RNG and allocation stay out of
+        # the timed region; each batch below is a view into this array
+        rng = np.random.default_rng(42)
+        all_vecs = rng.standard_normal(
+            (NUM_VECTORS, DIMENSIONS), dtype=np.float32
+        )
+
         print(f"\nInserting {NUM_VECTORS:,} vectors...")
         start_time = time.time()
 
@@ -41,11 +48,10 @@ def main():
             batch_end = min(batch_start + BATCH_SIZE, NUM_VECTORS)
             batch_size = batch_end - batch_start
 
-            batch = np.random.rand(batch_size, DIMENSIONS).astype(np.float32)
+            batch = all_vecs[batch_start:batch_end]
 
             batch_start_time = time.time()
-            for vec in batch:
-                index.add(vec)
+            index.add_many(batch)
             batch_time = time.time() - batch_start_time
 
             progress = (batch_end / NUM_VECTORS) * 100
@@ -70,18 +76,21 @@ def main():
 
         print("\nTesting search performance...")
 
-        # Pre-generate queries to avoid timing RNG
-        queries = np.random.rand(NUM_QUERIES, DIMENSIONS).astype(np.float32)
+        # Pre-generate queries to avoid timing RNG; same distribution as
+        # the indexed vectors
+        queries = rng.standard_normal(
+            (NUM_QUERIES, DIMENSIONS), dtype=np.float32
+        )
 
         search_times = []
 
         for q in queries:
             t0 = time.perf_counter()
-            results = index.search(q, k=K)
+            ids, _ = index.search_arrays(q, k=K)
             t1 = time.perf_counter()
 
             # Touch results to prevent dead-code elimination
-            _ = results[0].id
+            _ = ids[0]
             search_times.append(t1 - t0)
 
         avg = sum(search_times) / len(search_times)
@@ -94,6 +103,17 @@ def main():
         print(f"  Max: {max_t * 1000:.2f} ms")
         print(f"  Throughput: {1 / avg:,.0f} queries/sec")
 
+        # Same queries again, answered with a single FFI call
+        t0 = time.perf_counter()
+        ids, _ = index.search_many(queries, k=K)
+        batch_search_time = time.perf_counter() - t0
+
+        print(f"\nBatched search ({NUM_QUERIES} queries, k={K}):")
+        print(f"  Total: {batch_search_time * 1000:.2f} ms")
+        print(
+            f"  Throughput: {NUM_QUERIES / batch_search_time:,.0f} queries/sec"
+        )
+
     print("\n" + "=" * 60)
     print("Example complete!")
 
@@ -0,0 +1,17 @@
+"""Shared pytest configuration."""
+
+# Fixtures that give a test its own fresh, writable index, plus tmp_path for
+# tests that create an index file themselves. Tests that only read can use
+# the module-scoped populated_index_* fixtures instead.
+_MUTABLE_INDEX_FIXTURES = {"temp_index_path", "simple_index", "tmp_path"}
+
+
+def pytest_collection_modifyitems(items):
+    """Mark tests that build or write their own index.
+
+    Lets the read-only tests run on their own with
+    ``pytest -m "not mutates_index"``.
+    """
+    for item in items:
+        if _MUTABLE_INDEX_FIXTURES & set(getattr(item, "fixturenames", ())):
+            item.add_marker("mutates_index")
@@ -0,0 +1,66 @@
+"""Tests for low-level FFI helpers."""
+
+import numpy as np
+
+from chassis import VectorIndex, _ffi
+
+
+class TestFindLibrary:
+    """Test shared library discovery."""
+
+    def test_env_path_to_file(self, monkeypatch):
+        """Test CHASSIS_LIB_PATH pointing directly at the library file."""
+        monkeypatch.setenv("CHASSIS_LIB_PATH", str(_ffi._lib_path))
+        _ffi._find_library.cache_clear()
+        try:
+            assert _ffi._find_library() == _ffi._lib_path
+        finally:
+            _ffi._find_library.cache_clear()
+
+    def test_env_path_to_directory(self, monkeypatch):
+        """Test CHASSIS_LIB_PATH pointing at the containing directory."""
+        monkeypatch.setenv("CHASSIS_LIB_PATH", str(_ffi._lib_path.parent))
+        _ffi._find_library.cache_clear()
+        try:
+            assert _ffi._find_library() == _ffi._lib_path
+        finally:
+            _ffi._find_library.cache_clear()
+
+    def test_result_is_cached(self):
+        """Test repeated lookups reuse the first result."""
+        assert _ffi._find_library() is _ffi._find_library()
+
+
+class TestSimdKernel:
+    """Test distance kernel reporting."""
+
+    def test_simd_kernel_name_is_known(self):
+        """Test the library reports one of its known kernels."""
+        assert _ffi.get_simd_kernel() in {"avx2", "neon", "scalar"}
+
+    def test_active_kernel_matches_numpy(self, tmp_path):
+        """Test index distances match NumPy L2, whichever kernel is active."""
+        rng = np.random.default_rng(0)
+        # 37 dimensions exercise the SIMD main loop and the scalar tail
+        vectors = rng.standard_normal((64, 37), dtype=np.float32)
+        queries = rng.standard_normal((8, 37), dtype=np.float32)
+
+        with VectorIndex(tmp_path / "kernel.chassis", dimensions=37) as index:
+            index.add_many(vectors)
+            # ef covers the whole index, so the search is exhaustive
+            ids, dists = index.search_many(queries, k=10, ef=64)
+
+        expected = np.linalg.norm(
+            vectors[None, :, :] - queries[:, None, :], axis=2
+        )
+        kernel = _ffi.get_simd_kernel()
+        rows = np.arange(len(queries))[:, None]
+        np.testing.assert_allclose(
+            dists,
+            expected[rows, ids.astype(np.intp)],
+            rtol=1e-4,
+            err_msg=kernel,
+        )
+        np.testing.assert_array_equal(
+            ids[:, 0], expected.argmin(axis=1), err_msg=kernel
+        )
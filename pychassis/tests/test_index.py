@@ -2,13 +2,26 @@
 
 import numpy as np
 import pytest
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from chassis import VectorIndex, IndexOptions, SearchResult
+from chassis import VectorIndex, IndexOptions, SearchResult, SearchResultSet
 from chassis.exceptions import (
     ChassisError,
     DimensionMismatchError,
 )
+from chassis.util import morton_sort
+
+# Seeded generator shared by the tests in this module. Draws float32
+# directly instead of generating float64 and casting.
+RNG = np.random.default_rng(0)
+
+
+def V(*xs):
+    """Build a float32 vector, so calls take the binding's NumPy path."""
+    return np.asarray(xs, dtype=np.float32)
 
 
 @pytest.fixture
@@ -23,6 +36,73 @@ def simple_index(temp_index_path):
     return VectorIndex(temp_index_path, dimensions=3)
 
 
+# (num_vectors, dimensions) of the shared indexes the batch tests run on
+BATCH_SHAPES = [(50, 64), (100, 128), (500, 256)]
+
+
+def _build_populated_index(path, num_vectors, dimensions):
+    """Build an index of seeded random vectors; row i has ID i."""
+    # Own generator seeded by the shape rather than RNG, so the contents
+    # don't depend on which test happens to build the index first
+    rng = np.random.default_rng((num_vectors, dimensions))
+    vectors = rng.random((num_vectors, dimensions), dtype=np.float32)
+    index = VectorIndex(path, dimensions=dimensions)
+    index.add_many(vectors)
+    index.flush()
+    return index, vectors
+
+
+@pytest.fixture(scope="module")
+def populated_index_factory(tmp_path_factory):
+    """Return a function mapping (num_vectors, dimensions) to a shared index.
+
+    Each shape is built once per module on first use, so tests and
+    parametrizations that ask for the same shape share one graph build.
+    The function returns (index, vectors). Read-only: tests must not add
+    to or close the index.
+    """
+    cache = {}
+
+    def get(num_vectors, dimensions):
+        key = (num_vectors, dimensions)
+        if key not in cache:
+            path = tmp_path_factory.mktemp("idx") / "shared.chassis"
+            cache[key] = _build_populated_index(path, *key)
+        return cache[key]
+
+    yield get
+    for index, _ in cache.values():
+        index.close()
+
+
+@pytest.fixture(scope="module")
+def populated_index_3d(populated_index_factory):
+    """Shared 3D index with 50 vectors. See populated_index_factory."""
+    return populated_index_factory(50, 3)
+
+
+@pytest.fixture(scope="module")
+def populated_index_128d(populated_index_factory):
+    """Shared 128D index with 100 vectors. See populated_index_factory."""
+    return populated_index_factory(100, 128)
+
+
+def _check_batch_search(index, vectors, k=5):
+    """Search a batch of stored rows and check the result arrays."""
+    queries = vectors[:10]
+    ids, dists = index.search_many(queries, k=k)
+
+    assert ids.shape == (len(queries), k)
+    assert dists.shape == (len(queries), k)
+    assert ids.dtype == np.uint64
+    assert dists.dtype == np.float32
+
+    # Each stored row finds itself first, and rows are sorted
+    np.testing.assert_array_equal(ids[:, 0], np.arange(len(queries)))
+    np.testing.assert_allclose(dists[:, 0], 0.0, atol=1e-5)
+    assert (np.diff(dists, axis=1) >= 0).all()
+
+
 class TestVectorIndexBasics:
     """Test basic VectorIndex functionality."""
 
@@ -42,7 +122,7 @@ class TestVectorIndexBasics:
 
     def test_add_single_vector(self, simple_index):
         """Test adding a single vector."""
-        vec = [0.1, 0.2, 0.3]
+        vec = V(0.1, 0.2, 0.3)
         vector_id = simple_index.add(vec)
         assert vector_id == 0
         assert len(simple_index) == 1
@@ -51,9 +131,9 @@ class TestVectorIndexBasics:
     def test_add_multiple_vectors(self, simple_index):
         """Test adding multiple vectors."""
         vectors = [
-            [0.1, 0.2, 0.3],
-            [0.4, 0.5, 0.6],
-            [0.7, 0.8, 0.9],
+            V(0.1, 0.2, 0.3),
+            V(0.4, 0.5, 0.6),
+            V(0.7, 0.8, 0.9),
         ]
 
         ids = []
@@ -76,9 +156,58 @@ class TestVectorIndexBasics:
         vector_id = simple_index.add(vec)
         assert vector_id == 0
 
+    def test_add_numpy_array_non_contiguous(self, simple_index):
+        """Test adding a strided NumPy view (should be made contiguous)."""
+        data = np.arange(6, dtype=np.float32)
+        vec = data[::2]
+        assert not vec.flags.c_contiguous
+
+        vector_id = simple_index.add(vec)
+        assert vector_id == 0
+
+        results = simple_index.search(np.array([0.0, 2.0, 4.0]), k=1)
+        assert results[0].id == 0
+        assert results[0].distance < 1e-6
+
+    def test_add_fastpath_identity(self, simple_index):
+        """Test a C-contiguous float32 array reaches the FFI uncopied."""
+        seen = []
+        add_array = simple_index._add_array
+
+        def recording_add_array(vector):
+            seen.append(vector.ctypes.data)
+            return add_array(vector)
+
+        simple_index._add_array = recording_add_array
+        buf = np.zeros(3, dtype=np.float32)
+        simple_index.add(buf)
+        assert seen == [buf.ctypes.data]
+
+    def test_add_sequence_subclass(self, simple_index):
+        """Test list subclasses take the general path and still work."""
+
+        class Row(list):
+            pass
+
+        vector_id = simple_index.add(Row([0.1, 0.2, 0.3]))
+        assert vector_id == 0
+
+    def test_add_tuple(self, simple_index):
+        """Test adding a tuple of Python floats."""
+        vector_id = simple_index.add((0.1, 0.2, 0.3))
+        assert vector_id == 0
+
+    def test_add_lists_reuse_staging_buffer(self, simple_index):
+        """Test consecutive list inserts keep their own values."""
+        simple_index.add([1.0, 0.0, 0.0])
+        simple_index.add([0.0, 1.0, 0.0])
+
+        assert simple_index.search([1.0, 0.0, 0.0], k=1)[0].id == 0
+        assert simple_index.search([0.0, 1.0, 0.0], k=1)[0].id == 1
+
     def test_flush(self, simple_index):
         """Test flushing changes to disk."""
-        simple_index.add([0.1, 0.2, 0.3])
+        simple_index.add(V(0.1, 0.2, 0.3))
         simple_index.flush()  # Should not raise
 
 
@@ -87,13 +216,13 @@ class TestVectorIndexSearch:
 
     def test_search_empty_index(self, simple_index):
         """Test searching an empty index."""
-        query = [0.1, 0.2, 0.3]
+        query = V(0.1, 0.2, 0.3)
         results = simple_index.search(query, k=10)
         assert results == []
 
     def test_search_single_result(self, simple_index):
         """Test searching with one vector in index."""
-        vec = [0.1, 0.2, 0.3]
+        vec = V(0.1, 0.2, 0.3)
         simple_index.add(vec)
 
         results = simple_index.search(vec, k=10)
@@ -101,43 +230,67 @@ class TestVectorIndexSearch:
         assert results[0].id == 0
         assert results[0].distance < 1e-6  # Should be very close to 0
 
-    def test_search_multiple_results(self, simple_index):
+    def test_search_multiple_results(self, populated_index_3d):
         """Test searching with multiple vectors."""
-        vectors = [
-            [1.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0],
-            [0.0, 0.0, 1.0],
-        ]
+        index, vectors = populated_index_3d
 
-        for vec in vectors:
-            simple_index.add(vec)
-
-        # Search for vector closest to [1, 0, 0]
-        query = [0.9, 0.1, 0.1]
-        results = simple_index.search(query, k=3)
+        # A stored vector is its own nearest neighbor
+        results = index.search(vectors[7], k=3)
 
         assert len(results) == 3
-        assert results[0].id == 0  # [1, 0, 0] should be closest
+        assert results[0].id == 7
+        assert results[0].distance < 1e-6
         assert all(isinstance(r, SearchResult) for r in results)
 
         # Results should be sorted by distance
         distances = [r.distance for r in results]
         assert distances == sorted(distances)
 
-    def test_search_k_parameter(self, simple_index):
+    def test_search_k_parameter(self, populated_index_3d):
         """Test k parameter limits results."""
-        for i in range(10):
-            simple_index.add([float(i), 0.0, 0.0])
+        index, vectors = populated_index_3d
 
-        results_5 = simple_index.search([5.0, 0.0, 0.0], k=5)
-        results_3 = simple_index.search([5.0, 0.0, 0.0], k=3)
+        results_5 = index.search(vectors[5], k=5)
+        results_3 = index.search(vectors[5], k=3)
 
         assert len(results_5) == 5
         assert len(results_3) == 3
 
+    def test_search_ef_override(self, populated_index_128d):
+        """Test overriding ef_search for a single call."""
+        index, vectors = populated_index_128d
+
+        # Passing the configured value matches the default
+        default_ids, _ = index.search_arrays(vectors[3], k=5)
+        same_ids, _ = index.search_arrays(
+            vectors[3], k=5, ef=index.options.ef_search
+        )
+        np.testing.assert_array_equal(default_ids, same_ids)
+
+        # A wide search still finds the exact match first
+        results = index.search(vectors[3], k=5, ef=200)
+        assert len(results) == 5
+        assert results[0].id == 3
+
+        # ef below k is raised to k, not an error
+        assert len(index.search(vectors[3], k=5, ef=1)) == 5
+
+        ids, _ = index.search_many(vectors[:4], k=5, ef=200)
+        np.testing.assert_array_equal(ids[:, 0], np.arange(4))
+
+    def test_invalid_ef(self, populated_index_3d):
+        """Test search with invalid ef."""
+        index, vectors = populated_index_3d
+
+        with pytest.raises(ValueError, match="ef"):
+            index.search(vectors[0], k=1, ef=0)
+
+        with pytest.raises(ValueError, match="ef"):
+            index.search_many(vectors[:2], k=1, ef=-1)
+
     def test_search_numpy_query(self, simple_index):
         """Test searching with NumPy query."""
-        simple_index.add([1.0, 0.0, 0.0])
+        simple_index.add(V(1.0, 0.0, 0.0))
 
         query = np.array([0.9, 0.1, 0.0], dtype=np.float32)
         results = simple_index.search(query, k=1)
@@ -145,6 +298,66 @@ class TestVectorIndexSearch:
         assert len(results) == 1
         assert results[0].id == 0
 
+    def test_search_arrays(self, simple_index):
+        """Test searching with raw NumPy output arrays."""
+        for i in range(10):
+            simple_index.add(V(float(i), 0.0, 0.0))
+
+        ids, dists = simple_index.search_arrays(V(5.0, 0.0, 0.0), k=3)
+
+        assert ids.dtype == np.uint64
+        assert dists.dtype == np.float32
+        assert len(ids) == len(dists) == 3
+        assert ids[0] == 5
+        assert np.all(np.diff(dists) >= 0)
+
+        # search() reports the same neighbors
+        results = simple_index.search(V(5.0, 0.0, 0.0), k=3)
+        assert [r.id for r in results] == ids.tolist()
+
+    def test_search_arrays_empty_index(self, simple_index):
+        """Test raw search on an empty index."""
+        ids, dists = simple_index.search_arrays(V(0.1, 0.2, 0.3), k=10)
+        assert len(ids) == 0
+        assert len(dists) == 0
+
+    def test_search_many(self, simple_index):
+        """Test answering several queries with one call."""
+        for i in range(10):
+            simple_index.add(V(float(i), 0.0, 0.0))
+
+        queries = np.array(
+            [[2.0, 0.0, 0.0], [7.0, 0.0, 0.0]], dtype=np.float32
+        )
+        ids, dists = simple_index.search_many(queries, k=3)
+
+        assert ids.shape == (2, 3)
+        assert dists.shape == (2, 3)
+        assert ids[0, 0] == 2
+        assert ids[1, 0] == 7
+
+        # Each row matches the single-query search
+        for query, row in zip(queries, ids):
+            single_ids, _ = simple_index.search_arrays(query, k=3)
+            assert row.tolist() == single_ids.tolist()
+
+    def test_search_many_pads_short_rows(self, simple_index):
+        """Test padding when fewer than k neighbors exist."""
+        simple_index.add(V(1.0, 0.0, 0.0))
+
+        ids, dists = simple_index.search_many([[1.0, 0.0, 0.0]], k=3)
+
+        assert ids[0, 0] == 0
+        assert (ids[0, 1:] == np.iinfo(np.uint64).max).all()
+        assert np.isinf(dists[0, 1:]).all()
+
+    def test_search_many_dimension_mismatch(self, simple_index):
+        """Test batch search with wrong query dimensions."""
+        simple_index.add(V(0.1, 0.2, 0.3))
+
+        with pytest.raises(DimensionMismatchError):
+            simple_index.search_many(np.zeros((2, 2), dtype=np.float32))
+
 
 class TestVectorIndexErrors:
     """Test error handling."""
@@ -154,35 +367,81 @@ class TestVectorIndexErrors:
         with pytest.raises(DimensionMismatchError):
             simple_index.add([0.1, 0.2])  # Only 2D, expects 3D
 
+    def test_dimension_mismatch_2d_input(self, simple_index):
+        """Test passing a matrix where a single vector is expected."""
+        matrix = np.zeros((3, 3), dtype=np.float32)
+
+        with pytest.raises(DimensionMismatchError):
+            simple_index.add(matrix)
+
+        with pytest.raises(DimensionMismatchError):
+            simple_index.search(matrix, k=1)
+
+    def test_dimension_mismatch_nested_list(self, simple_index):
+        """Test nested lists are rejected like 2D arrays."""
+        row = [0.1, 0.2, 0.3]
+
+        with pytest.raises(DimensionMismatchError):
+            simple_index.add([row] * 3)  # Length matches, elements don't
+
+        with pytest.raises(DimensionMismatchError):
+            simple_index.add(([row], [row], [row]))
+
+        with pytest.raises(DimensionMismatchError):
+            simple_index.add([row])
+
+        assert len(simple_index) == 0
+
     def test_dimension_mismatch_search(self, simple_index):
         """Test searching with wrong dimensions."""
-        simple_index.add([0.1, 0.2, 0.3])
+        simple_index.add(V(0.1, 0.2, 0.3))
 
         with pytest.raises(DimensionMismatchError):
-            simple_index.search([0.1, 0.2], k=1)  # Only 2D
+            simple_index.search(V(0.1, 0.2), k=1)  # Only 2D
 
     def test_closed_index_operations(self, simple_index):
         """Test operations on closed index."""
         simple_index.close()
 
         with pytest.raises(ChassisError, match="closed"):
-            simple_index.add([0.1, 0.2, 0.3])
+            simple_index.add(V(0.1, 0.2, 0.3))
 
         with pytest.raises(ChassisError, match="closed"):
-            simple_index.search([0.1, 0.2, 0.3], k=1)
+            simple_index.search(V(0.1, 0.2, 0.3), k=1)
 
         with pytest.raises(ChassisError, match="closed"):
             len(simple_index)
 
+        with pytest.raises(ChassisError, match="closed"):
+            simple_index.flush()
+
+        assert "status=closed" in repr(simple_index)
+
+    def test_close_is_idempotent(self, simple_index):
+        """Test closing an index more than once."""
+        simple_index.close()
+        simple_index.close()
+
+    def test_close_after_failed_init(self, temp_index_path):
+        """Test close() (and so __del__) on a half-initialized index."""
+        index = VectorIndex.__new__(VectorIndex)
+        with pytest.raises(ValueError):
+            index.__init__(
+                temp_index_path,
+                dimensions=3,
+                options=IndexOptions(max_connections=0),
+            )
+        index.close()
+
     def test_invalid_k(self, simple_index):
         """Test search with invalid k."""
-        simple_index.add([0.1, 0.2, 0.3])
+        simple_index.add(V(0.1, 0.2, 0.3))
 
         with pytest.raises(ValueError):
-            simple_index.search([0.1, 0.2, 0.3], k=0)
+            simple_index.search(V(0.1, 0.2, 0.3), k=0)
 
         with pytest.raises(ValueError):
-            simple_index.search([0.1, 0.2, 0.3], k=-1)
+            simple_index.search(V(0.1, 0.2, 0.3), k=-1)
 
 
 class TestIndexOptions:
@@ -225,6 +484,37 @@ class TestIndexOptions:
         with pytest.raises(ValueError):
             options.validate()
 
+        # prefetch_depth negative
+        options = IndexOptions(prefetch_depth=-1)
+        with pytest.raises(ValueError):
+            options.validate()
+
+    def test_prefetch_options_preserve_results(self, temp_index_path):
+        """Test that prefetch settings change speed only, not results."""
+        vectors = RNG.random((200, 64), dtype=np.float32)
+        queries = RNG.random((10, 64), dtype=np.float32)
+
+        with VectorIndex(temp_index_path, dimensions=64) as index:
+            index.add_many(vectors)
+            index.flush()
+            expected_ids, expected_dists = index.search_many(queries, k=10)
+
+        for depth, full_vector in [
+            (0, False),
+            (1, False),
+            (2, True),
+            (4, True),
+        ]:
+            options = IndexOptions(
+                prefetch_depth=depth, prefetch_full_vector=full_vector
+            )
+            with VectorIndex(
+                temp_index_path, dimensions=64, options=options
+            ) as index:
+                ids, dists = index.search_many(queries, k=10)
+            np.testing.assert_array_equal(ids, expected_ids)
+            np.testing.assert_array_equal(dists, expected_dists)
+
 
 class TestIndexPersistence:
     """Test index persistence across sessions."""
@@ -233,8 +523,8 @@ class TestIndexPersistence:
         """Test reopening an index."""
         # Create and populate index
         with VectorIndex(temp_index_path, dimensions=3) as index:
-            index.add([1.0, 0.0, 0.0])
-            index.add([0.0, 1.0, 0.0])
+            index.add(V(1.0, 0.0, 0.0))
+            index.add(V(0.0, 1.0, 0.0))
             index.flush()
 
         # Reopen and verify
@@ -242,7 +532,7 @@ class TestIndexPersistence:
             assert len(index) == 2
             assert index.dimensions == 3
 
-            results = index.search([0.9, 0.1, 0.0], k=1)
+            results = index.search(V(0.9, 0.1, 0.0), k=1)
             assert len(results) == 1
             assert results[0].id == 0
 
@@ -250,7 +540,7 @@ class TestIndexPersistence:
         """Test reopening with wrong dimensions."""
         # Create 3D index
         with VectorIndex(temp_index_path, dimensions=3) as index:
-            index.add([1.0, 0.0, 0.0])
+            index.add(V(1.0, 0.0, 0.0))
             index.flush()
 
         # Try to reopen as 5D (should fail)
@@ -259,7 +549,7 @@ class TestIndexPersistence:
 
 
 class TestSearchResult:
-    """Test SearchResult dataclass."""
+    """Test SearchResult named tuple."""
 
     def test_search_result_creation(self):
         """Test creating SearchResult."""
@@ -267,6 +557,17 @@ class TestSearchResult:
         assert result.id == 42
         assert result.distance == 1.5
 
+    def test_search_result_is_tuple(self):
+        """Test that SearchResult unpacks and carries no instance dict."""
+        result = SearchResult(7, 0.25)
+        id_, distance = result
+        assert (id_, distance) == (7, 0.25)
+        assert result == (7, 0.25)
+        assert not hasattr(result, "__dict__")
+
+        with pytest.raises(AttributeError):
+            result.id = 8
+
     def test_search_result_repr(self):
         """Test SearchResult string representation."""
         result = SearchResult(id=10, distance=2.345678)
@@ -275,6 +576,46 @@ class TestSearchResult:
         assert "2.345678" in repr_str
 
 
+class TestSearchResultSet:
+    """Test SearchResultSet container."""
+
+    def test_search_returns_result_set(self, simple_index):
+        """Test search results expose the underlying arrays."""
+        simple_index.add(V(1.0, 0.0, 0.0))
+        simple_index.add(V(0.0, 1.0, 0.0))
+
+        results = simple_index.search(V(1.0, 0.0, 0.0), k=2)
+        assert isinstance(results, SearchResultSet)
+        assert results.ids.dtype == np.uint64
+        assert results.distances.dtype == np.float32
+        assert results.ids[0] == 0
+        assert np.asarray(results.distances) is results.distances
+
+    def test_sequence_behaviour(self):
+        """Test indexing, slicing, iteration and equality."""
+        results = SearchResultSet(
+            np.array([3, 1], dtype=np.uint64),
+            np.array([0.5, 1.5], dtype=np.float32),
+        )
+        expected = [
+            SearchResult(id=3, distance=0.5),
+            SearchResult(id=1, distance=1.5),
+        ]
+
+        assert len(results) == 2
+        assert results[-1] == expected[1]
+        assert isinstance(results[0].id, int)
+        assert list(results) == expected
+        assert results == expected
+        assert results[:1] == expected[:1]
+        assert (
+            SearchResultSet(
+                np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.float32)
+            )
+            == []
+        )
+
+
 class TestVectorIndexProperties:
     """Test VectorIndex properties and methods."""
 
@@ -282,17 +623,17 @@ class TestVectorIndexProperties:
         """Test __len__ method."""
         assert len(simple_index) == 0
 
-        simple_index.add([0.1, 0.2, 0.3])
+        simple_index.add(V(0.1, 0.2, 0.3))
         assert len(simple_index) == 1
 
-        simple_index.add([0.4, 0.5, 0.6])
+        simple_index.add(V(0.4, 0.5, 0.6))
         assert len(simple_index) == 2
 
     def test_is_empty(self, simple_index):
         """Test is_empty method."""
         assert simple_index.is_empty()
 
-        simple_index.add([0.1, 0.2, 0.3])
+        simple_index.add(V(0.1, 0.2, 0.3))
         assert not simple_index.is_empty()
 
     def test_dimensions_property(self, simple_index):
@@ -324,36 +665,202 @@ class TestBatchOperations:
         """Test batch inserting NumPy arrays."""
         index = VectorIndex(temp_index_path, dimensions=128)
 
-        # Generate 100 random vectors
-        vectors = np.random.rand(100, 128).astype(np.float32)
-
-        ids = []
-        for vec in vectors:
-            vector_id = index.add(vec)
-            ids.append(vector_id)
+        # Generate 100 random vectors and insert them in one call, in
+        # Morton order as a bulk build would
+        vectors = RNG.random((100, 128), dtype=np.float32)
+        order = morton_sort(vectors)
+        ids = index.add_many(vectors[order])
 
-        assert len(ids) == 100
-        assert ids == list(range(100))
+        np.testing.assert_array_equal(ids, np.arange(100))
         assert len(index) == 100
 
+        # IDs follow insertion order, not the original row order
+        results = index.search(vectors[order[7]], k=1)
+        assert results[0].id == 7
+
         index.flush()
 
-    def test_batch_search(self, temp_index_path):
+    def test_batch_search(self, populated_index_128d):
         """Test batch searching."""
-        index = VectorIndex(temp_index_path, dimensions=64)
+        _check_batch_search(*populated_index_128d)
+
+    @pytest.mark.parametrize("num_vectors,dimensions", BATCH_SHAPES)
+    def test_batch_search_shapes(
+        self, populated_index_factory, num_vectors, dimensions
+    ):
+        """Test batch searching across index sizes and dimensions."""
+        index, vectors = populated_index_factory(num_vectors, dimensions)
+        assert len(index) == num_vectors
+        _check_batch_search(index, vectors)
+
+    def test_batch_search_reuses_out_buffers(self, populated_index_128d):
+        """Test repeated batch searches writing into caller buffers."""
+        index, _ = populated_index_128d
+        queries = RNG.random((10, 128), dtype=np.float32)
+        expected_ids, expected_dists = index.search_many(queries, k=5)
+
+        out_ids = np.empty((10, 5), dtype=np.uint64)
+        out_dists = np.empty((10, 5), dtype=np.float32)
+        for _ in range(10):
+            ids, dists = index.search_many(
+                queries, k=5, out_ids=out_ids, out_dists=out_dists
+            )
+            assert ids is out_ids
+            assert dists is out_dists
+            assert ids.shape == (10, 5)
+
+        np.testing.assert_array_equal(out_ids, expected_ids)
+        np.testing.assert_array_equal(out_dists, expected_dists)
+
+    def test_batch_search_invalid_out_buffers(self, populated_index_3d):
+        """Test rejection of output buffers the FFI cannot write into."""
+        index, _ = populated_index_3d
+        queries = RNG.random((4, 3), dtype=np.float32)
+
+        bad_buffers = [
+            np.empty((4, 5), dtype=np.int64),  # wrong dtype
+            np.empty((4, 6), dtype=np.uint64),  # wrong shape
+            np.empty((5, 4), dtype=np.uint64).T,  # not C-contiguous
+        ]
+        readonly = np.empty((4, 5), dtype=np.uint64)
+        readonly.flags.writeable = False
+        bad_buffers.append(readonly)
 
-        # Add vectors
-        for i in range(50):
-            vec = np.random.rand(64).astype(np.float32)
-            index.add(vec)
+        for out_ids in bad_buffers:
+            with pytest.raises(ValueError):
+                index.search_many(queries, k=5, out_ids=out_ids)
 
-        # Batch search
-        queries = [np.random.rand(64).astype(np.float32) for _ in range(10)]
-        all_results = []
+        with pytest.raises(ValueError):
+            index.search_many(
+                queries, k=5, out_dists=np.empty((4, 5), dtype=np.float64)
+            )
 
-        for query in queries:
-            results = index.search(query, k=5)
-            all_results.append(results)
+    def test_add_many(self, temp_index_path):
+        """Test inserting a 2D batch with a single call."""
+        index = VectorIndex(temp_index_path, dimensions=128)
+
+        vectors = RNG.random((100, 128), dtype=np.float32)
+        ids = index.add_many(vectors)
+
+        assert ids.dtype == np.uint64
+        assert ids.tolist() == list(range(100))
+        assert len(index) == 100
+
+        # IDs keep counting from the previous batch
+        ids = index.add_many(vectors[:10])
+        assert ids.tolist() == list(range(100, 110))
+
+        index.flush()
+
+    def test_add_many_converts_input(self, simple_index):
+        """Test batch input that needs dtype/layout conversion."""
+        # float64, Fortran-ordered, and a plain list of lists
+        f64 = np.asfortranarray(np.eye(3, dtype=np.float64))
+        ids = simple_index.add_many(f64)
+        assert ids.tolist() == [0, 1, 2]
+
+        ids = simple_index.add_many([[0.5, 0.5, 0.0], [0.0, 0.5, 0.5]])
+        assert ids.tolist() == [3, 4]
+
+        # Rows land intact after conversion
+        assert simple_index.search([0.0, 1.0, 0.0], k=1)[0].id == 1
+        assert simple_index.search([0.5, 0.5, 0.0], k=1)[0].id == 3
+
+    def test_add_many_alignment_independent(self, tmp_path):
+        """Test that buffer alignment does not change the stored rows."""
+        vectors = RNG.random((20, 16), dtype=np.float32)
+
+        # Copy into a 64-byte aligned slot and a 4-byte offset slot of
+        # one raw buffer
+        raw = np.empty(20 * 16 + 32, dtype=np.float32)
+        start = (-raw.ctypes.data % 64) // 4
+        aligned = raw[start : start + 20 * 16].reshape(20, 16)
+        misaligned = raw[start + 1 : start + 1 + 20 * 16].reshape(20, 16)
+        assert aligned.ctypes.data % 64 == 0
+        assert misaligned.ctypes.data % 64 != 0
+
+        results = []
+        for name, buf in (("a", aligned), ("m", misaligned)):
+            buf[:] = vectors
+            index = VectorIndex(tmp_path / f"{name}.chassis", dimensions=16)
+            np.testing.assert_array_equal(index.add_many(buf), np.arange(20))
+            results.append(index.search_many(vectors, k=5))
+            index.close()
+
+        np.testing.assert_array_equal(results[0][0], results[1][0])
+        np.testing.assert_array_equal(results[0][1], results[1][1])
+
+    def test_add_many_empty(self, simple_index):
+        """Test inserting an empty batch."""
+        ids = simple_index.add_many(np.empty((0, 3), dtype=np.float32))
+        assert len(ids) == 0
+        assert simple_index.is_empty()
+
+    def test_add_many_dimension_mismatch(self, simple_index):
+        """Test batch with wrong row dimensions."""
+        with pytest.raises(DimensionMismatchError):
+            simple_index.add_many(np.zeros((4, 2), dtype=np.float32))
+
+        with pytest.raises(DimensionMismatchError):
+            simple_index.add_many(np.zeros(3, dtype=np.float32))
+
+        assert simple_index.is_empty()
+
+
+class TestConcurrency:
+    """Test concurrent readers."""
+
+    def test_concurrent_search_matches_serial(self, temp_index_path):
+        """Test searches from several threads return serial results."""
+        index = VectorIndex(temp_index_path, dimensions=32)
+        index.add_many(RNG.random((200, 32), dtype=np.float32))
+        index.flush()
+
+        queries = RNG.random((64, 32), dtype=np.float32)
+        expected = [index.search_arrays(q, k=5)[0].tolist() for q in queries]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            actual = list(
+                executor.map(
+                    lambda q: index.search_arrays(q, k=5)[0].tolist(),
+                    queries,
+                )
+            )
+
+        assert actual == expected
+
+    @pytest.mark.skipif(
+        (os.cpu_count() or 1) < 2, reason="needs at least 2 CPU cores"
+    )
+    def test_parallel_search_does_not_serialize(self, temp_index_path):
+        """Test concurrent searches are correct and overlap in time."""
+        index = VectorIndex(temp_index_path, dimensions=256)
+        index.add_many(RNG.random((2000, 256), dtype=np.float32))
+        index.flush()
 
-        assert len(all_results) == 10
-        assert all(len(results) <= 5 for results in all_results)
+        # Large ef keeps each call dominated by Rust time, which runs
+        # with the GIL released
+        queries = RNG.random((300, 256), dtype=np.float32)
+
+        def run_all():
+            return [
+                index.search_arrays(q, k=10, ef=200)[0].tolist()
+                for q in queries
+            ]
+
+        start = time.perf_counter()
+        expected = run_all()
+        single = time.perf_counter() - start
+
+        # Two threads doing the same work each: about 1x the single-thread
+        # time if they overlap, about 2x if calls serialize on the GIL
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(run_all) for _ in range(2)]
+            results = [f.result() for f in futures]
+        concurrent = time.perf_counter() - start
+
+        assert results == [expected, expected]
+        assert (
+            concurrent < single * 1.5
+        ), f"2 threads took {concurrent:.3f}s vs {single:.3f}s for one"
@@ -0,0 +1,51 @@
+"""Tests for the optional Numba distance kernels."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from chassis import VectorIndex  # noqa: E402
+from chassis.kernels import l2_squared, l2_squared_batch  # noqa: E402
+
+
+class TestKernels:
+    """Test kernels against NumPy reference results."""
+
+    def test_l2_squared(self):
+        """Test single-pair distance."""
+        rng = np.random.default_rng(0)
+        a = rng.random(128, dtype=np.float32)
+        b = rng.random(128, dtype=np.float32)
+
+        expected = np.sum((a - b) ** 2)
+        assert l2_squared(a, b) == pytest.approx(expected, rel=1e-5)
+
+    def test_l2_squared_identical(self):
+        """Test distance of a vector to itself."""
+        a = np.arange(16, dtype=np.float32)
+        assert l2_squared(a, a) == 0.0
+
+    def test_l2_squared_batch(self):
+        """Test one-to-many distances."""
+        rng = np.random.default_rng(1)
+        query = rng.random(64, dtype=np.float32)
+        vectors = rng.random((200, 64), dtype=np.float32)
+
+        expected = np.sum((vectors - query) ** 2, axis=1)
+        np.testing.assert_allclose(
+            l2_squared_batch(query, vectors), expected, rtol=1e-5
+        )
+
+    def test_matches_index_distances(self, tmp_path):
+        """Test kernel agrees with distances reported by the index."""
+        rng = np.random.default_rng(2)
+        vectors = rng.random((20, 32), dtype=np.float32)
+        query = rng.random(32, dtype=np.float32)
+
+        with VectorIndex(tmp_path / "k.chassis", dimensions=32) as index:
+            index.add_many(vectors)
+            ids, dists = index.search_arrays(query, k=5)
+
+        rerank = l2_squared_batch(query, vectors[ids.astype(np.intp)])
+        np.testing.assert_allclose(np.sqrt(rerank), dists, rtol=1e-4)
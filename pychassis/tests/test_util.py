@@ -0,0 +1,56 @@
+"""Tests for chassis.util helpers."""
+
+import numpy as np
+import pytest
+
+from chassis.util import morton_sort
+
+
+class TestMortonSort:
+    """Test Morton-order insertion helper."""
+
+    def test_morton_sort_is_permutation(self):
+        """Test the result is a permutation of the row indices."""
+        vectors = np.random.default_rng(0).random((500, 128), dtype=np.float32)
+        order = morton_sort(vectors)
+
+        assert order.dtype == np.intp
+        np.testing.assert_array_equal(np.sort(order), np.arange(500))
+
+    def test_morton_sort_order(self):
+        """Test corners of the unit cube follow the Z-order curve."""
+        # Morton key bit order is x (lowest), y, z
+        corners = np.array(
+            [[1, 1, 1], [0, 0, 1], [1, 0, 0], [0, 0, 0], [0, 1, 0]],
+            dtype=np.float32,
+        )
+        order = morton_sort(corners)
+        assert corners[order].tolist() == [
+            [0, 0, 0],
+            [1, 0, 0],
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 1, 1],
+        ]
+
+    def test_morton_sort_groups_nearby_vectors(self):
+        """Test points from separate clusters end up contiguous."""
+        rng = np.random.default_rng(1)
+        centers = np.array([[0.1] * 3, [0.9] * 3], dtype=np.float32)
+        labels = rng.integers(0, 2, size=200)
+        vectors = centers[labels] + rng.normal(0, 0.01, (200, 3))
+
+        sorted_labels = labels[morton_sort(vectors)]
+        # One boundary between the two clusters
+        assert np.count_nonzero(np.diff(sorted_labels)) == 1
+
+    def test_morton_sort_edge_shapes(self):
+        """Test empty input, fewer than 3 dims and constant columns."""
+        assert morton_sort(np.empty((0, 8))).tolist() == []
+        assert morton_sort(np.ones((4, 2))).tolist() == [0, 1, 2, 3]
+        assert morton_sort([[2.0], [0.0], [1.0]]).tolist() == [1, 2, 0]
+
+    def test_morton_sort_requires_2d(self):
+        """Test rejection of input that is not (N, D)."""
+        with pytest.raises(ValueError):
+            morton_sort(np.zeros(8))